@@ -0,0 +1,71 @@
+import importlib
+from typing import Callable, List, Optional, Tuple
+from instance import SetCoverInstance
+
+class Algorithm:
+    def __init__(self, name: str, module: str, function: str, solver: str, seeded: bool = True,
+                 writes_trace: bool = True, arguments: Callable = lambda args: (args.inst, args.time, args.seed),
+                 solve_call: Callable = lambda solver, instance, cutoff, seed, trace, options:
+                     solver(instance, cutoff, seed, trace=trace, **options)):
+        """
+        Registry entry for a solver whose module is only imported when it is first used.
+
+        Args:
+            name: Name used with -alg, in service requests and in output filenames
+            module: Module that defines the solver
+            function: Name of the run function taking an instance path
+            solver: Name of the function solving an in-memory SetCoverInstance
+            seeded: Whether output filenames include the seed
+            writes_trace: Whether the run function returns a trace (and a .trace file is written)
+            arguments: Builds the run function's positional arguments from the parsed command line
+            solve_call: Calls `solver` with (instance, cutoff, seed, trace, options) and returns
+                (1-based solution, cost, trace)
+        """
+        self.name = name
+        self.module = module
+        self.function = function
+        self.solver = solver
+        self.seeded = seeded
+        self.writes_trace = writes_trace
+        self.arguments = arguments
+        self.solve_call = solve_call
+        self._run = None
+        self._solve = None
+
+    def load(self) -> Callable:
+        """Import the solver module on first use and return its run function."""
+        if self._run is None:
+            self._run = getattr(importlib.import_module(self.module), self.function)
+        return self._run
+
+    def load_solver(self) -> Callable:
+        """Import the solver module on first use and return its in-memory solver function."""
+        if self._solve is None:
+            self._solve = getattr(importlib.import_module(self.module), self.solver)
+        return self._solve
+
+    def solve(self, instance: SetCoverInstance, cutoff: float, seed: int, trace: Optional[list] = None,
+              **options) -> Tuple[List[int], int, List[Tuple[float, int]]]:
+        """Run the solver on an in-memory instance and return 1-based subset indices, cost and trace."""
+        return self.solve_call(self.load_solver(), instance, cutoff, seed, trace, options)
+
+ALGORITHMS = {}
+
+def register_algorithm(algorithm: Algorithm):
+    """Add an algorithm to the registry used by the command line, decomposition and the service."""
+    ALGORITHMS[algorithm.name] = algorithm
+
+register_algorithm(Algorithm('BnB', 'bnb', 'run_branch_and_bound', 'branch_and_bound', seeded=False,
+                             arguments=lambda args: (args.inst, args.time, args.workers or 1),
+                             solve_call=lambda solver, instance, cutoff, seed, trace, options:
+                                 solver(instance.universe, instance.subsets, cutoff, trace)))
+register_algorithm(Algorithm('Approx', 'approximation', 'run_approximation', 'greedy_approximation', seeded=False,
+                             writes_trace=False, arguments=lambda args: (args.inst,),
+                             solve_call=lambda solver, instance, cutoff, seed, trace, options:
+                                 solver(instance) + ([] if trace is None else trace,)))
+register_algorithm(Algorithm('LS1', 'localsearch_hc', 'run_hill_climbing', 'hill_climbing'))
+register_algorithm(Algorithm('LS2', 'localsearch_sa', 'run_simulated_annealing', 'simulated_annealing'))
+register_algorithm(Algorithm('LS2B', 'localsearch_sa_batch', 'run_batched_simulated_annealing',
+                             'batched_simulated_annealing',
+                             arguments=lambda args: (args.inst, args.time, args.seed, args.chains, args.tempering)))
+register_algorithm(Algorithm('LNS', 'localsearch_lns', 'run_large_neighborhood_search', 'large_neighborhood_search'))
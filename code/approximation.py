@@ -1,5 +1,5 @@
 from typing import List, Tuple
-from instance import SetCoverInstance, read_instance
+from instance import SetCoverInstance, read_instance, remove_redundant_subsets
 
 def greedy_approximation(instance: SetCoverInstance) -> Tuple[List[int], int]:
     """"
@@ -10,7 +10,7 @@ def greedy_approximation(instance: SetCoverInstance) -> Tuple[List[int], int]:
 
     Returns:
         Tuple[List[int], int]: A tuple containing:
-            1. A list of 1-based indices of the selected subsets forming the cover.
+            1. A list of 1-based indices of the selected subsets forming the cover, without redundant subsets.
             2. The number of subsets used (cost of the solution).
     """
     solution = []
@@ -40,7 +40,8 @@ def greedy_approximation(instance: SetCoverInstance) -> Tuple[List[int], int]:
         solution.append(best_idx)
         # Convert index back to 0-based for subset access
         covered.update(instance.subsets[best_idx-1])
-        
+
+    solution = remove_redundant_subsets(instance.subsets, solution)
     return solution, len(solution)
 
 def run_approximation(instance_path: str) -> Tuple[List[int], int]:
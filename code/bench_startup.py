@@ -0,0 +1,44 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# (label, statement run in a fresh interpreter from this directory)
+CASES = [
+    ('main (lazy registry)', 'import main'),
+    ('main + all solvers (eager imports)',
+     'import main, bnb, approximation, localsearch_hc, localsearch_sa, localsearch_sa_batch, localsearch_lns'),
+    ('main + Approx solver only', "import main; main.ALGORITHMS['Approx'].load()"),
+    ('decompose + Approx solver only', "import decompose; decompose.ALGORITHMS['Approx'].load_solver()"),
+    ('evaluate (deferred imports)', 'import evaluate'),
+    ('evaluate + numpy + matplotlib (eager imports)',
+     "import evaluate, numpy, matplotlib; matplotlib.use('Agg'); import matplotlib.pyplot"),
+]
+
+
+def time_statement(statement: str, repeats: int) -> float:
+    """Median wall-clock time in ms to start an interpreter and run `statement`."""
+    code_dir = os.path.dirname(os.path.abspath(__file__))
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], cwd=code_dir, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure CLI startup time with lazy and eager imports')
+    parser.add_argument('-repeats', type=int, default=10, help='Interpreter launches per case')
+    args = parser.parse_args()
+
+    baseline = time_statement('pass', args.repeats)
+    print(f"{'bare interpreter':<48} {baseline:8.1f} ms")
+    for label, statement in CASES:
+        print(f"{label:<48} {time_statement(statement, args.repeats):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
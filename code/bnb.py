@@ -1,7 +1,10 @@
+import heapq
+import multiprocessing
+import queue as queue_module
 import time
 from queue import PriorityQueue
 from typing import List, Tuple
-from instance import read_instance
+from instance import read_instance, remove_redundant_subsets
 
 
 def greedy_set_cover(universe, sets):
@@ -35,17 +38,18 @@ def greedy_set_cover(universe, sets):
     return cover
 
 
-def branch_and_bound(universe, sets, cutoff):
+def branch_and_bound(universe, sets, cutoff, trace=None):
     """
     Branch and Bound algorithm to solve the Set Cover problem.
 
     Args:
         instance (SetCoverInstance): Object containing the universe and subsets.
         cutoff (int): Time limit in seconds for the algorithm to run.
+        trace (list, optional): List to append (time, cost) updates to as they happen.
 
     Returns:
         Tuple[List[int], int, List[Tuple[float, int]]]: A tuple containing:
-            1. List of selected subset indices.
+            1. List of 1-based indices of the selected subsets.
             2. Cost of the solution (number of subsets).
             3. Trace of (time, cost) for solution updates.
     """
@@ -53,9 +57,9 @@ def branch_and_bound(universe, sets, cutoff):
     start_time = time.time()
     best_solution = None
     best_cost = float('inf')
-    trace = []
+    trace = [] if trace is None else trace
 
-    greedy_solution = greedy_set_cover(universe, sets)
+    greedy_solution = remove_redundant_subsets(sets, greedy_set_cover(universe, sets), index_base=0)
     upper_bound = len(greedy_solution)
     best_solution = greedy_solution[:]
     best_cost = upper_bound
@@ -83,6 +87,7 @@ def branch_and_bound(universe, sets, cutoff):
             continue
 
         if covered == universe:
+            selected = remove_redundant_subsets(sets, selected, index_base=0)
             if len(selected) < best_cost:
                 best_cost = len(selected)
                 best_solution = selected[:]
@@ -107,15 +112,196 @@ def branch_and_bound(universe, sets, cutoff):
         if lb < best_cost and queue.qsize() < MAX_QUEUE:
             queue.put((lb, selected, covered, remaining))
 
-    return best_solution, best_cost, trace
+    return [i + 1 for i in best_solution], best_cost, trace
 
 
-def run_branch_and_bound(instance_path: str, cutoff: int) -> Tuple[List[int], int, List[Tuple[float, int]]]:
+def _bnb_worker(universe, sets, cutoff, start_time, shared, best, lock, idle, pending, results, workers, max_queue):
+    """
+    Worker process of the parallel branch and bound.
+
+    Expands nodes from a local best-first heap with the same branching rule as `branch_and_bound`.
+    Nodes are (priority, selected, covered, next subset index). When the local heap runs dry the
+    worker steals from the shared queue; while other workers are idle it donates half of its heap.
+    """
+    # Nodes still buffered for the shared queue at the cutoff are useless: do not wait to flush
+    # them on exit, or the worker blocks forever once nobody reads the queue any more
+    shared.cancel_join_thread()
+    m = len(sets)
+    local = []
+    counter = 0  # heap tie-breaker
+    nodes = 0
+
+    while time.time() - start_time < cutoff:
+        if not local:
+            with lock:
+                idle.value += 1
+            node = None
+            while node is None and time.time() - start_time < cutoff:
+                try:
+                    node = shared.get(timeout=0.05)
+                except queue_module.Empty:
+                    with lock:
+                        if idle.value == workers and pending.value == 0:
+                            break
+            if node is None:
+                break
+            with lock:
+                idle.value -= 1
+                pending.value -= 1
+            heapq.heappush(local, (node[0], counter, node[1], node[2], node[3]))
+            counter += 1
+
+        lb, _, selected, covered, k = heapq.heappop(local)
+        nodes += 1
+        best_cost = best.value
+
+        if lb >= best_cost:
+            continue
+
+        if covered == universe:
+            selected = remove_redundant_subsets(sets, selected, index_base=0)
+            with lock:
+                if len(selected) < best.value:
+                    best.value = len(selected)
+                    results.put(('solution', time.time() - start_time, len(selected), selected))
+            continue
+
+        if k >= m:
+            continue
+
+        new_selected = selected + [k]
+        gain = len(sets[k] - covered)
+        new_lb = len(new_selected)
+        priority = new_lb - gain * 0.01  # favor higher gain
+
+        if new_lb < best_cost and gain > 0 and len(local) < max_queue:
+            heapq.heappush(local, (priority, counter, new_selected, covered | sets[k], k + 1))
+            counter += 1
+
+        if lb < best_cost and len(local) < max_queue:
+            heapq.heappush(local, (lb, counter, selected, covered, k + 1))
+            counter += 1
+
+        # Share work with idle workers
+        if idle.value > 0 and len(local) > 1 and nodes % 64 == 0:
+            donated = [heapq.heappop(local) for _ in range(len(local) // 2)]
+            with lock:
+                pending.value += len(donated)
+            for priority, _, selected, covered, k in donated:
+                shared.put((priority, selected, covered, k))
+
+    results.put(('nodes', nodes))
+
+
+def parallel_branch_and_bound(universe, sets, cutoff, workers, trace=None):
+    """
+    Branch and Bound spread over worker processes.
+
+    The root is expanded breadth-first into a frontier of subproblems that seeds a shared queue.
+    Workers search their subproblems best-first, share the incumbent cost through shared memory so
+    every worker prunes with the best bound found so far, and rebalance by donating nodes to idle
+    workers. Improvements are merged into a single trace ordered by time.
+
+    Args:
+        universe (set): The set of all elements to be covered.
+        sets (List[set]): List of subsets that can be used to cover the universe.
+        cutoff (int): Time limit in seconds for the algorithm to run.
+        workers (int): Number of worker processes.
+        trace (list, optional): List to append (time, cost) updates to.
+
+    Returns:
+        Tuple[List[int], int, List[Tuple[float, int]]]: A tuple containing:
+            1. List of 1-based indices of the selected subsets.
+            2. Cost of the solution (number of subsets).
+            3. Trace of (time, cost) for solution updates.
+    """
+
+    start_time = time.time()
+    trace = [] if trace is None else trace
+
+    best_solution = remove_redundant_subsets(sets, greedy_set_cover(universe, sets), index_base=0)
+    best_cost = len(best_solution)
+    trace.append((0.0, best_cost))
+
+    # Split the tree into enough subproblems to keep every worker busy
+    m = len(sets)
+    frontier = [(0, [], set(), 0)]
+    while frontier and len(frontier) < 4 * workers:
+        lb, selected, covered, k = frontier.pop(0)
+        if covered == universe or k >= m:
+            frontier.append((lb, selected, covered, k))
+            break
+        gain = len(sets[k] - covered)
+        if gain > 0 and len(selected) + 1 < best_cost:
+            frontier.append((len(selected) + 1 - gain * 0.01, selected + [k], covered | sets[k], k + 1))
+        frontier.append((lb, selected, covered, k + 1))
+
+    ctx = multiprocessing.get_context()
+    shared = ctx.Queue()
+    results = ctx.Queue()
+    lock = ctx.Lock()
+    best = ctx.Value('i', best_cost, lock=False)
+    idle = ctx.Value('i', 0, lock=False)
+    pending = ctx.Value('i', len(frontier), lock=False)
+    for node in frontier:
+        shared.put(node)
+
+    max_queue = 800000 // workers
+    processes = [
+        ctx.Process(target=_bnb_worker, args=(universe, sets, cutoff, start_time, shared, best, lock, idle, pending,
+                                              results, workers, max_queue), daemon=True)
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    improvements = []
+    nodes = 0
+    finished = 0
+    while finished < workers:
+        try:
+            message = results.get(timeout=0.5)
+        except queue_module.Empty:
+            if not any(process.is_alive() for process in processes) and results.empty():
+                break
+            continue
+        if message[0] == 'solution':
+            improvements.append(message[1:])
+        else:
+            nodes += message[1]
+            finished += 1
+
+    # Drop nodes left in the shared queue so no process blocks on a full pipe, then stop the workers
+    while True:
+        try:
+            shared.get(timeout=0.05)
+        except queue_module.Empty:
+            break
+    for process in processes:
+        process.join(timeout=1.0)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+    # Deterministic merge: order by time, then cost, then solution
+    for elapsed, cost, solution in sorted(improvements):
+        if cost < best_cost:
+            best_cost = cost
+            best_solution = solution
+            trace.append((elapsed, cost))
+
+    elapsed = time.time() - start_time
+    print(f"Explored {nodes} nodes in {elapsed:.2f}s ({nodes / max(elapsed, 1e-9):.0f} nodes/sec) with {workers} workers")
+    return [i + 1 for i in best_solution], best_cost, trace
+
+
+def run_branch_and_bound(instance_path: str, cutoff: int, workers: int = 1) -> Tuple[List[int], int, List[Tuple[float, int]]]:
     """"
     Run greedy approximation algorithm with trace.
 
     Args:
         instance_path (str): Path to the file containing the set cover instance.
+        workers (int): Number of worker processes; more than 1 runs `parallel_branch_and_bound`.
 
     Returns:
         Tuple[List[int], int]: A tuple containing:
@@ -124,5 +310,6 @@ def run_branch_and_bound(instance_path: str, cutoff: int) -> Tuple[List[int], in
     """
 
     instance = read_instance(instance_path)
-    solution, cost, trace = branch_and_bound(instance.universe, instance.subsets, cutoff)
-    return solution, cost, trace
+    if workers > 1:
+        return parallel_branch_and_bound(instance.universe, instance.subsets, cutoff, workers)
+    return branch_and_bound(instance.universe, instance.subsets, cutoff)
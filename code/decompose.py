@@ -0,0 +1,216 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from instance import SetCoverInstance
+from algorithms import ALGORITHMS
+
+
+class Component:
+    def __init__(self, elements: List[int], subset_ids: List[int], instance: SetCoverInstance):
+        """
+        Independent block of a set cover instance.
+
+        Args:
+            elements: Original element labels in this block
+            subset_ids: Original 1-based indices of the subsets in this block
+            instance: The block relabelled as a standalone instance (elements 1..len(elements))
+        """
+        self.elements = elements
+        self.subset_ids = subset_ids
+        self.instance = instance
+
+    def size(self) -> int:
+        """Total incidence of the block, used to split the time budget."""
+        return sum(len(s) for s in self.instance.subsets)
+
+
+def find_components(instance: SetCoverInstance) -> List[Component]:
+    """
+    Split an instance into the connected components of its element-subset incidence graph.
+
+    Uses union-find over the elements: all elements of a subset are joined together. Empty subsets
+    and elements that no subset covers are left out, since they never change a cover.
+
+    Args:
+        instance: The set cover instance.
+
+    Returns:
+        The components, largest first.
+    """
+    parent = list(range(instance.n + 1))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # path halving
+            x = parent[x]
+        return x
+
+    for subset in instance.subsets:
+        it = iter(subset)
+        first = next(it, None)
+        if first is None:
+            continue
+        root = find(first)
+        for elem in it:
+            other = find(elem)
+            if other != root:
+                parent[other] = root
+
+    groups: Dict[int, Tuple[List[int], List[int]]] = {}
+    for idx, subset in enumerate(instance.subsets, start=1):
+        if subset:
+            groups.setdefault(find(next(iter(subset))), ([], []))[1].append(idx)
+    for elem in range(1, instance.n + 1):
+        root = find(elem)
+        if root in groups:
+            groups[root][0].append(elem)
+
+    components = []
+    for elements, subset_ids in groups.values():
+        relabel = {elem: i for i, elem in enumerate(elements, start=1)}
+        subsets = [{relabel[e] for e in instance.subsets[idx - 1]} for idx in subset_ids]
+        components.append(Component(elements, subset_ids, SetCoverInstance(len(elements), len(subset_ids), subsets)))
+
+    components.sort(key=lambda c: c.size(), reverse=True)
+    return components
+
+
+def solve_instance(instance: SetCoverInstance, algorithm: str, cutoff: float, seed: int, trace: Optional[list] = None,
+                   **options) -> Tuple[List[int], int, List[Tuple[float, int]]]:
+    """
+    Run one of the algorithms on an in-memory instance.
+
+    Args:
+        instance: The set cover instance.
+        algorithm: Name of a registered algorithm (see `algorithms.ALGORITHMS`); its module is imported on first use.
+        cutoff: Time limit in seconds (ignored by Approx).
+        seed: Random seed for reproducibility.
+        trace: Optional list the algorithm appends (time, cost) updates to as they happen.
+        options: Extra keyword arguments for LS2B (chains, tempering).
+
+    Returns:
+        Tuple of 1-based subset indices, cost and (time, cost) trace. Approx returns an empty trace.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Invalid algorithm specified. Please choose from: {', '.join(ALGORITHMS)}.")
+    return ALGORITHMS[algorithm].solve(instance, cutoff, seed, trace, **options)
+
+
+def _solve_component(component: Component, algorithm: str, cutoff: float, seed: int,
+                     options: dict) -> Tuple[float, List[int], List[Tuple[float, int]]]:
+    """Solve one component and map its cover back to the original indices."""
+    started = time.time()
+    solution, _, trace = solve_instance(component.instance, algorithm, cutoff, seed, **options)
+    return started, [component.subset_ids[i - 1] for i in solution], trace
+
+
+def _solve_lane(components: List[Component], algorithm: str, deadline: float, seed: int,
+                options: dict) -> List[Tuple[float, List[int], List[Tuple[float, int]]]]:
+    """
+    Worker entry point: solve components one after another until the wall-clock `deadline`.
+
+    Each component gets the time left in proportion to its share of the remaining size, so time lost
+    to process start-up or to a component running over its budget is taken from the later ones.
+    """
+    results = []
+    remaining_size = sum(c.size() for c in components)
+    for component in components:
+        budget = max(0.0, deadline - time.time()) * component.size() / remaining_size
+        remaining_size -= component.size()
+        results.append(_solve_component(component, algorithm, budget, seed, options))
+    return results
+
+
+def merge_traces(start_time: float, runs: List[Tuple[float, List[Tuple[float, int]]]]) -> List[Tuple[float, int]]:
+    """
+    Merge per-component traces into one trace of the total cover size.
+
+    Args:
+        start_time: Wall-clock start of the whole solve.
+        runs: (wall-clock start, trace) of every component.
+
+    Returns:
+        (time, cost) entries, starting once every component has reported a cover.
+    """
+    events = []
+    for k, (started, trace) in enumerate(runs):
+        for elapsed, cost in trace:
+            events.append((started - start_time + elapsed, k, cost))
+    events.sort()
+
+    current: List[Optional[int]] = [None] * len(runs)
+    missing = len(runs)
+    merged = []
+    for t, k, cost in events:
+        if current[k] is None:
+            missing -= 1
+        current[k] = cost
+        if missing == 0:
+            total = sum(current)
+            if merged and merged[-1][0] == t:
+                merged[-1] = (t, total)
+            elif not merged or total < merged[-1][1]:
+                merged.append((t, total))
+    return merged
+
+
+def solve_decomposed(instance: SetCoverInstance, algorithm: str, cutoff: float, seed: int, workers: int = None,
+                     **options) -> Tuple[List[int], int, List[Tuple[float, int]]]:
+    """
+    Solve every connected component independently in worker processes and merge the results.
+
+    Components made of a single subset are taken directly. The others are dealt largest first to
+    the least loaded of `workers` lanes; every lane runs in its own process and solves its
+    components in turn, splitting the time left until start + cutoff in proportion to their size.
+
+    Args:
+        instance: The set cover instance.
+        algorithm: Name of a registered algorithm (see `algorithms.ALGORITHMS`).
+        cutoff: Time limit in seconds for the whole solve.
+        seed: Random seed for reproducibility.
+        workers: Number of worker processes (defaults to the number of CPUs).
+        options: Extra keyword arguments for LS2B (chains, tempering).
+
+    Returns:
+        Tuple of 1-based subset indices, cost and merged (time, cost) trace.
+    """
+    start_time = time.time()
+    components = find_components(instance)
+    print(f"Decomposed into {len(components)} components")
+
+    solution = []
+    hard = []
+    for component in components:
+        if component.instance.m == 1:
+            solution.extend(component.subset_ids)
+        else:
+            hard.append(component)
+
+    # Trivial components contribute a constant cost from the start
+    runs = [(start_time, [(0.0, len(solution))])] if solution else []
+
+    # Longest-processing-time-first: each component goes to the lane with the least total size
+    workers = workers or os.cpu_count() or 1
+    lanes = [[] for _ in range(min(workers, len(hard)))]
+    loads = [0] * len(lanes)
+    for component in hard:
+        k = loads.index(min(loads))
+        lanes[k].append(component)
+        loads[k] += component.size()
+
+    deadline = start_time + cutoff
+    if len(lanes) > 1:
+        with ProcessPoolExecutor(max_workers=len(lanes)) as pool:
+            futures = [pool.submit(_solve_lane, lane, algorithm, deadline, seed, options) for lane in lanes]
+            results = [future.result() for future in futures]
+    else:
+        results = [_solve_lane(lane, algorithm, deadline, seed, options) for lane in lanes]
+
+    for lane_results in results:
+        for started, cover, trace in lane_results:
+            solution.extend(cover)
+            runs.append((started, trace))
+
+    trace = merge_traces(start_time, runs) if ALGORITHMS[algorithm].writes_trace else []
+    return solution, len(solution), trace
@@ -0,0 +1,183 @@
+from typing import Iterable, List, Optional, Set, Tuple
+from instance import SetCoverInstance
+from approximation import greedy_approximation
+from localsearch_hc import hill_climbing
+
+
+class DynamicSetCover:
+    def __init__(self, instance: SetCoverInstance, solution: Optional[List[int]] = None):
+        """
+        Set cover instance that is edited in place while a cover is kept valid incrementally.
+
+        Subset indices and element labels stay stable across edits: a removed subset is kept as an
+        empty set, a removed element label is not reused, and added subsets and elements get the
+        next free index.
+
+        Args:
+            instance: The set cover instance (copied, the original is not modified)
+            solution: Current cover as 1-based subset indices (defaults to the greedy approximation)
+        """
+        self.instance = SetCoverInstance(instance.n, instance.m, [set(s) for s in instance.subsets])
+        if solution is None:
+            solution, _ = greedy_approximation(self.instance)
+        self.solution: Set[int] = set(solution)
+
+        # containing[e - 1]: subsets that contain element e
+        self.containing: List[Set[int]] = [set() for _ in range(instance.n)]
+        for idx, subset in enumerate(self.instance.subsets, start=1):
+            for elem in subset:
+                self.containing[elem - 1].add(idx)
+
+        # Maintain coverage count for each element
+        self.coverage_count = [0] * instance.n
+        for idx in self.solution:
+            for elem in self.instance.subsets[idx - 1]:
+                self.coverage_count[elem - 1] += 1
+        self.uncovered = {i + 1 for i, count in enumerate(self.coverage_count) if count == 0}
+
+    def cover(self) -> Tuple[List[int], int]:
+        """Return the current cover (sorted 1-based indices) and its cost."""
+        return sorted(self.solution), len(self.solution)
+
+    def add_subset(self, elements: Iterable[int]) -> int:
+        """Add a subset over existing elements and return its 1-based index."""
+        subset = set(elements)
+        self.instance.subsets.append(subset)
+        self.instance.m += 1
+        idx = self.instance.m
+        for elem in subset:
+            self.containing[elem - 1].add(idx)
+        return idx
+
+    def remove_subset(self, idx: int):
+        """Remove a subset. If it was selected, the elements only it covered become uncovered."""
+        subset = self.instance.subsets[idx - 1]
+        for elem in subset:
+            self.containing[elem - 1].discard(idx)
+        if idx in self.solution:
+            self.solution.discard(idx)
+            for elem in subset:
+                self.coverage_count[elem - 1] -= 1
+                if self.coverage_count[elem - 1] == 0:
+                    self.uncovered.add(elem)
+        self.instance.subsets[idx - 1] = set()
+
+    def add_element(self, subset_ids: Iterable[int]) -> int:
+        """Add a new element contained in the given subsets and return its label."""
+        self.instance.n += 1
+        elem = self.instance.n
+        self.instance.universe.add(elem)
+        self.containing.append(set())
+        self.coverage_count.append(0)
+        for idx in subset_ids:
+            self.instance.subsets[idx - 1].add(elem)
+            self.containing[elem - 1].add(idx)
+            if idx in self.solution:
+                self.coverage_count[elem - 1] += 1
+        if self.coverage_count[elem - 1] == 0:
+            self.uncovered.add(elem)
+        return elem
+
+    def remove_element(self, elem: int):
+        """Remove an element from the universe and its subsets, dropping selected subsets made redundant."""
+        touched = self.containing[elem - 1]
+        self.containing[elem - 1] = set()
+        self.instance.universe.discard(elem)
+        self.uncovered.discard(elem)
+        self.coverage_count[elem - 1] = 0
+        for idx in touched:
+            self.instance.subsets[idx - 1].discard(elem)
+        self._drop_redundant(sorted(touched))
+
+    def _drop_redundant(self, candidates: Iterable[int]):
+        """Deselect, in order, the candidate subsets whose elements are all covered by another selected subset."""
+        for idx in candidates:
+            subset = self.instance.subsets[idx - 1]
+            if idx in self.solution and all(self.coverage_count[elem - 1] > 1 for elem in subset):
+                self.solution.discard(idx)
+                for elem in subset:
+                    self.coverage_count[elem - 1] -= 1
+
+    def repair(self) -> Tuple[List[int], int]:
+        """
+        Restore a valid cover after edits, touching only the affected part of the instance.
+
+        Uncovered elements are covered greedily with the subsets that contain them, then the
+        selected subsets overlapping the newly added ones are dropped if they became redundant.
+        Elements that no subset contains stay uncovered.
+
+        Returns:
+            The repaired cover (sorted 1-based indices) and its cost.
+        """
+        added = []
+        while self.uncovered:
+            candidates = set()
+            for elem in self.uncovered:
+                candidates |= self.containing[elem - 1]
+            if not candidates:
+                break
+            best_idx = max(candidates, key=lambda j: (len(self.instance.subsets[j - 1] & self.uncovered), -j))
+            self.solution.add(best_idx)
+            added.append(best_idx)
+            for elem in self.instance.subsets[best_idx - 1]:
+                self.coverage_count[elem - 1] += 1
+            self.uncovered -= self.instance.subsets[best_idx - 1]
+
+        # Only subsets sharing elements with the new ones can have become redundant
+        neighbors = []
+        for idx in added:
+            for elem in self.instance.subsets[idx - 1]:
+                neighbors.extend(j for j in self.containing[elem - 1] if j in self.solution)
+        self._drop_redundant(dict.fromkeys(neighbors))
+
+        return self.cover()
+
+    def apply(self, edits: Iterable[Tuple]) -> Tuple[List[int], int]:
+        """
+        Apply an edit batch and repair the cover.
+
+        Args:
+            edits: Tuples ('add_subset', elements), ('remove_subset', idx), ('add_element', subset_ids)
+                or ('remove_element', elem)
+
+        Returns:
+            The repaired cover (sorted 1-based indices) and its cost.
+        """
+        for edit in edits:
+            if edit[0] == 'add_subset':
+                self.add_subset(edit[1])
+            elif edit[0] == 'remove_subset':
+                self.remove_subset(edit[1])
+            elif edit[0] == 'add_element':
+                self.add_element(edit[1])
+            elif edit[0] == 'remove_element':
+                self.remove_element(edit[1])
+            else:
+                raise ValueError(f"Invalid edit: {edit[0]}. Please choose from: add_subset, remove_subset, "
+                                 f"add_element, remove_element.")
+        return self.repair()
+
+    def polish(self, cutoff: float, seed: int) -> Tuple[List[int], int, List[Tuple[float, int]]]:
+        """
+        Run a short hill climbing from the current cover and keep the result if it is smaller.
+
+        Returns:
+            The polished cover (sorted 1-based indices), its cost and the hill climbing trace.
+        """
+        if self.uncovered:
+            return self.cover() + ([],)
+
+        instance = self.instance
+        if len(instance.universe) < instance.n:
+            # hill_climbing expects elements 1..n: close the gaps left by removed elements
+            relabel = {elem: i for i, elem in enumerate(sorted(instance.universe), start=1)}
+            instance = SetCoverInstance(len(relabel), instance.m, [{relabel[e] for e in s} for s in instance.subsets])
+
+        solution, cost, trace = hill_climbing(instance, cutoff, seed, initial_solution=sorted(self.solution))
+        if cost < len(self.solution):
+            self.solution = set(solution)
+            self.coverage_count = [0] * self.instance.n
+            for idx in self.solution:
+                for elem in self.instance.subsets[idx - 1]:
+                    self.coverage_count[elem - 1] += 1
+        return self.cover() + (trace,)
@@ -0,0 +1,157 @@
+import random
+from typing import Dict, List, Optional, Set
+
+
+class ElitePool:
+    def __init__(self, subsets: List[Set[int]], capacity: int = 10, seed: int = 0, index_base: int = 1,
+                 relink_interval: int = 16):
+        """
+        Bounded pool of the best distinct covers seen by a local search.
+
+        Solutions are identified by a Zobrist hash (XOR of one random 64-bit key per selected subset),
+        so duplicates are rejected in O(|solution|) and the hash of a neighbor differs from its parent by
+        a single XOR.
+
+        Args:
+            subsets: List of sets containing elements (the instance subsets)
+            capacity: Maximum number of elite solutions kept
+            seed: Random seed for the Zobrist keys and for sampling
+            index_base: 1 if solutions use 1-based subset indices, 0 for 0-based
+            relink_interval: A restart relinks when the pool changed, or otherwise every this many restarts
+        """
+        self.subsets = subsets
+        self.capacity = capacity
+        self.index_base = index_base
+        self.rng = random.Random(seed)
+        self.keys = [self.rng.getrandbits(64) for _ in range(len(subsets) + index_base)]
+        self.elites: List[List[int]] = []
+        self.hashes: Dict[int, int] = {}  # Zobrist hash -> position in self.elites
+        self.relink_interval = relink_interval
+        self.restarts = 0
+        self.version = 0  # bumped whenever the pool changes
+        self.relinked_version = -1
+
+    def __len__(self) -> int:
+        return len(self.elites)
+
+    def zobrist(self, solution) -> int:
+        """Zobrist hash of a solution given as an iterable of subset indices."""
+        h = 0
+        for idx in solution:
+            h ^= self.keys[idx]
+        return h
+
+    def add(self, solution) -> bool:
+        """
+        Offer a feasible cover to the pool.
+
+        Duplicates are ignored. When the pool is full, the newcomer replaces the worst elite that is
+        not better than it, preferring the one most similar to the newcomer to keep the pool diverse.
+
+        Returns:
+            True if the solution was inserted.
+        """
+        solution = list(solution)
+        h = self.zobrist(solution)
+        if h in self.hashes:
+            return False
+
+        if len(self.elites) < self.capacity:
+            self.hashes[h] = len(self.elites)
+            self.elites.append(solution)
+            self.version += 1
+            return True
+
+        members = set(solution)
+        candidates = [i for i, elite in enumerate(self.elites) if len(elite) >= len(solution)]
+        if not candidates:
+            return False
+        victim = max(candidates, key=lambda i: (len(self.elites[i]), -len(members.symmetric_difference(self.elites[i]))))
+
+        del self.hashes[self.zobrist(self.elites[victim])]
+        self.hashes[h] = victim
+        self.elites[victim] = solution
+        self.version += 1
+        return True
+
+    def best(self) -> Optional[List[int]]:
+        """Return a copy of the smallest elite cover, or None if the pool is empty."""
+        if not self.elites:
+            return None
+        return min(self.elites, key=len).copy()
+
+    def sample(self) -> List[int]:
+        """Return a copy of a uniformly random elite in O(1)."""
+        return self.rng.choice(self.elites).copy()
+
+    def path_relink(self, source: List[int], target: List[int]) -> Optional[List[int]]:
+        """
+        Walk from `source` towards `target` and return the best intermediate cover.
+
+        Every step adds one subset that is only in `target`, choosing the one that makes the most
+        source-only subsets redundant, and then drops every source-only subset that became redundant,
+        so all intermediate solutions stay feasible.
+
+        Returns:
+            The smallest intermediate cover strictly better than both endpoints, or None.
+        """
+        base = self.index_base
+        current = set(source)
+        coverage_count: Dict[int, int] = {}
+        for idx in current:
+            for elem in self.subsets[idx - base]:
+                coverage_count[elem] = coverage_count.get(elem, 0) + 1
+
+        to_add = set(target) - current
+        to_drop = current - set(target)
+        best = None
+        best_cost = min(len(source), len(target))
+
+        while to_add:
+            # Elements that only a single source-only subset still covers
+            critical = {}
+            for idx in to_drop:
+                for elem in self.subsets[idx - base]:
+                    if coverage_count[elem] == 1:
+                        critical.setdefault(idx, set()).add(elem)
+
+            def freed(j):
+                return sum(1 for elems in critical.values() if elems <= self.subsets[j - base])
+
+            step = max(to_add, key=freed)
+            to_add.discard(step)
+            current.add(step)
+            for elem in self.subsets[step - base]:
+                coverage_count[elem] = coverage_count.get(elem, 0) + 1
+
+            for idx in list(to_drop):
+                if all(coverage_count[elem] > 1 for elem in self.subsets[idx - base]):
+                    to_drop.discard(idx)
+                    current.discard(idx)
+                    for elem in self.subsets[idx - base]:
+                        coverage_count[elem] -= 1
+
+            if len(current) < best_cost:
+                best = list(current)
+                best_cost = len(current)
+
+        return best
+
+    def restart(self) -> List[int]:
+        """
+        Restart point for a local search: a random elite in O(1).
+
+        Path relinking between two random elites is only tried when the pool changed since the last
+        relink, or every `relink_interval` restarts; a smaller cover found that way is returned instead.
+        """
+        self.restarts += 1
+        start = self.sample()
+        if len(self.elites) > 1 and (self.version != self.relinked_version
+                                     or self.restarts % self.relink_interval == 0):
+            relinked = self.path_relink(start, self.sample())
+            if relinked is not None:
+                self.add(relinked)
+            self.relinked_version = self.version
+            if relinked is not None:
+                return relinked
+        return start
@@ -1,9 +1,23 @@
+import argparse
 import glob
+import hashlib
+import html
+import json
 import os
 import csv
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal, ROUND_HALF_UP
-import matplotlib.pyplot as plt
-import numpy as np
+
+DPI = 300
+CACHE_FILE = '.report_cache.json'
+
+def _pyplot():
+    """Import pyplot on first use with the headless Agg backend, so table-only runs skip matplotlib."""
+    import matplotlib
+    matplotlib.use('Agg')  # render to files only, never open windows
+    import matplotlib.pyplot as plt
+    return plt
 
 def read_input(filename,type=None):
     """
@@ -27,36 +41,112 @@ def read_input(filename,type=None):
 
         return float(elapsed),float(best_cost)
 
-def write_solution(filename, dict):
+def write_summary_csv(filename, rows):
     """
-    Write solution to file
+    Write the comparison table to a CSV file
     
     Args:
         filename: Path to output file
-        dict
+        rows: list of dicts with the keys of the header
     """
     with open(filename, 'w', newline='') as f:
         writer = csv.writer(f)
-        header = ['Dataset', 'Time', 'Value', 'RelErr']
+        header = ['Dataset', 'Algorithm', 'Cutoff', 'Runs', 'Time', 'Value', 'RelErr']
         writer.writerow(header)
         
-        for key, values in dict.items():
-            row = [key] + values
-            writer.writerow(row)
+        for row in rows:
+            writer.writerow([row[key] for key in header])
+
+def write_summary_html(filename, rows, figures):
+    """
+    Write the comparison table and links to all figures to a single HTML page
+
+    Args:
+        filename: Path to output file
+        rows: list of dicts with the keys of the CSV header
+        figures: dict mapping dataset name to the list of figure file names
+    """
+    header = ['Dataset', 'Algorithm', 'Cutoff', 'Runs', 'Time', 'Value', 'RelErr']
+    lines = ['<!DOCTYPE html>', '<html><head><meta charset="utf-8"><title>Set Cover report</title></head><body>',
+             '<h1>Comparison table</h1>', '<table border="1" cellpadding="4">',
+             '<tr>' + ''.join(f'<th>{h}</th>' for h in header) + '</tr>']
+    for row in rows:
+        lines.append('<tr>' + ''.join(f'<td>{html.escape(str(row[h]))}</td>' for h in header) + '</tr>')
+    lines.append('</table>')
+
+    for dataset in sorted(figures):
+        lines.append(f'<h2>{html.escape(dataset)}</h2>')
+        for name in figures[dataset]:
+            lines.append(f'<img src="{html.escape(name)}" width="480">')
+    lines.append('</body></html>')
+
+    with open(filename, 'w') as f:
+        f.write('\n'.join(lines))
 
 def round_(value):
     return Decimal(value).quantize(Decimal("0.00"), rounding=ROUND_HALF_UP)
 
 
-def plot_qrtd(instance_name, qrtd_data, colors=None):
+def compute_qrtd(times, values, opt, q_stars=(0.0, 0.2, 0.4, 0.6, 0.8, 1.0)):
+    """
+    Compute QRTDs: fraction of runs reaching q* % of the optimum by each time point.
+
+    Returns:
+        Dictionary with q* as keys and list of (time, fraction) tuples as values
+    """
+    import numpy as np
+
+    sorted_indices = np.argsort(times)
+    sorted_times = np.array(times)[sorted_indices]
+    sorted_values = np.array(values)[sorted_indices]
+    num_runs = len(times)
+    time_points = np.linspace(0, max(times), 100)
+
+    results = {}
+    for q in q_stars:
+        threshold = opt + (q/100) * opt
+        idx = np.searchsorted(sorted_times, time_points, side='right')
+        solved = np.concatenate(([0], np.cumsum(sorted_values <= threshold)))
+        results[q] = list(zip(time_points, solved[idx] / num_runs))
+    return results
+
+def compute_sqd(times, values, opt):
+    """
+    Compute SQDs: fraction of runs within q % of the optimum at ten time points.
+
+    Returns:
+        Dictionary with time points as keys and list of (quality, fraction) tuples as values
+    """
+    import numpy as np
+
+    sorted_indices = np.argsort(times)
+    sorted_times = np.array(times)[sorted_indices]
+    sorted_values = np.array(values)[sorted_indices]
+    num_runs = len(times)
+    max_time = max(times)
+    q_values = np.linspace(0, 10, 51)
+
+    sqd_results = {}
+    for time_point in [max_time * i / 10 for i in range(1, 11)]:
+        idx = np.searchsorted(sorted_times, time_point, side='right')
+        finished = sorted_values[:idx]
+        thresholds = opt + (q_values/100) * opt
+        fractions = (finished[None, :] <= thresholds[:, None]).sum(axis=1) / num_runs
+        sqd_results[time_point] = list(zip(q_values, fractions))
+    return sqd_results
+
+def plot_qrtd(instance_name, qrtd_data, path, colors=None, dpi=DPI):
     """
     Plot QRTDs for different q* values.
     
     Parameters:
     - instance_name: Name of the problem instance
     - qrtd_data: Dictionary with q* as keys and list of (time, fraction) tuples as values
+    - path: Output image file
     - colors: Optional dictionary mapping q* values to colors
+    - dpi: Resolution of the saved image
     """
+    plt = _pyplot()
     plt.figure(figsize=(10, 6))    
     
     if not colors:
@@ -79,15 +169,16 @@ def plot_qrtd(instance_name, qrtd_data, colors=None):
     plt.grid(True, linestyle='--', alpha=0.7)
     plt.legend()
     plt.tight_layout()
-    plt.savefig(f'qrtd_{instance_name}.png', dpi=300)
-    plt.show()
+    plt.savefig(path, dpi=dpi)
+    plt.close()
 
-def plot_sqd(problem_name, sqd_data, colors=None):
+def plot_sqd(problem_name, sqd_data, path, colors=None, dpi=DPI):
     """Plot SQDs for different time points"""
     if not sqd_data:
         print(f"No data to plot for {problem_name}")
         return
     
+    plt = _pyplot()
     plt.figure(figsize=(10, 6))
     
     if not colors:        
@@ -105,135 +196,145 @@ def plot_sqd(problem_name, sqd_data, colors=None):
     plt.legend()
     plt.ylim(0, 1.05)  
     plt.tight_layout()
-    plt.savefig(f'sqd_{problem_name}.png', dpi=300)
-    plt.show()
+    plt.savefig(path, dpi=dpi)
+    plt.close()
 
-def boxplot_(boxplot_dic):
+def boxplot_(instance_name, boxplot_dic, path, dpi=DPI):
+    plt = _pyplot()
+    plt.figure(figsize=(10, 6))
     plt.boxplot(boxplot_dic.values(), tick_labels=boxplot_dic.keys())
-    plt.title(f"Execution Time Distribution for large 1 and large10")
+    plt.title(f"Execution Time Distribution for {instance_name}")
     plt.ylabel("Time (seconds)")
     plt.grid(True)
-    plt.savefig(f'boxplot_large1_large10.png', dpi=300)
-    plt.show()
-
-def main():
+    plt.savefig(path, dpi=dpi)
+    plt.close()
 
+def render_figure(task):
     """
-    Main function to process trace and optimal solution files, evaluate performance,
-    and generate visualizations including a comparison table, boxplots, QRTDs, and SQDs.
-    """
+    Render one figure; runs in a worker process.
 
-    from collections import defaultdict
-    trace_dic=defaultdict(list)
-    opt_dic = defaultdict(int)
-    
-    
-    tracenames="*.trace"
-    inst_trace = glob.glob(tracenames)
-    for file_path in inst_trace:
-        elapsed, best_cost = read_input(file_path)
-        instance_name = os.path.splitext(os.path.basename(file_path))[0] 
-        instance_name = instance_name.split("_")[0]        
-        trace_dic[instance_name].append([elapsed, best_cost])
-    
-    plot_dic=trace_dic.copy()
-
-    for key, value in trace_dic.items(): 
-        avg = [sum(x) / len(x) for x in zip(*value)]
-        trace_dic[key] =avg   
+    Args:
+        task: (kind, title, data, path, dpi) where kind is 'qrtd', 'sqd' or 'box'
+    """
+    kind, title, data, path, dpi = task
+    if kind == 'box':
+        boxplot_(title, data, path, dpi=dpi)
+    else:
+        times, values, opt = data
+        if kind == 'qrtd':
+            plot_qrtd(title, compute_qrtd(times, values, opt), path, dpi=dpi)
+        else:
+            plot_sqd(title, compute_sqd(times, values, opt), path, dpi=dpi)
+    return path
 
-    optnames="*.out"
-    inst_opt = glob.glob(optnames)    
-    for file_path in inst_opt:
-        opt=read_input(file_path,"OUT")
-        instance_name = os.path.splitext(os.path.basename(file_path))[0] 
-        opt_dic[instance_name] = opt
-        RelErr=trace_dic[instance_name][1]/opt-1
-        trace_dic[instance_name].append(RelErr)      
+def task_hash(task):
+    """Hash of everything a figure is drawn from, used to skip unchanged figures."""
+    kind, title, data, _, dpi = task
+    payload = json.dumps([kind, title, data, dpi], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
 
-    trace_dic = dict(sorted(trace_dic.items(), key=lambda item: (item[0], item[1][0],item[1][0])))
+def generate_report(input_dir='.', output_dir='report', workers=None, table_only=False, dpi=DPI):
+    """
+    Build the full evaluation report without any interactive window.
 
-    ##### generate comparision table ####
+    Reads every *.trace (named <instance>_<alg>_<cutoff>[_<seed>].trace) and the optional optimal
+    values in *.out from `input_dir`, then writes to `output_dir`:
+    summary.csv and summary.html with one row per instance/algorithm/cutoff, a QRTD and an SQD
+    plot per instance/algorithm/cutoff and a runtime boxplot per instance.
+    Figures are rendered in a process pool and skipped when their input data did not change.
+    Without a readable .out file the best value found over all runs of the instance is used as
+    reference. RelErr is left empty when the reference value is 0.
+    With `table_only` only summary.csv is written and neither NumPy nor matplotlib is imported.
+    Figures are saved at `dpi` (300 by default, as before the report was headless).
+    """
+    os.makedirs(output_dir, exist_ok=True)
 
-    write_solution("compre_table", trace_dic)
+    runs = defaultdict(list)
+    for file_path in glob.glob(os.path.join(input_dir, "*.trace")):
+        parts = os.path.splitext(os.path.basename(file_path))[0].split("_")
+        if len(parts) < 3:
+            continue
+        runs[(parts[0], parts[1], parts[2])].append(read_input(file_path))
 
+    opt_dic = {}
+    for file_path in glob.glob(os.path.join(input_dir, "*.out")):
+        try:
+            opt_dic[os.path.splitext(os.path.basename(file_path))[0]] = read_input(file_path, "OUT")
+        except (IndexError, ValueError):
+            print(f"Skipping {file_path}: no optimal value")
+    best_found = defaultdict(lambda: float('inf'))
+    for (instance_name, _, _), results in runs.items():
+        best_found[instance_name] = min(best_found[instance_name], min(value for _, value in results))
+    for instance_name, best in best_found.items():
+        opt_dic.setdefault(instance_name, best)
 
-    ##### Boxplot ###
+    ##### comparison table ####
+    rows = []
+    for (instance_name, alg, cutoff), results in sorted(runs.items()):
+        times = [t for t, _ in results]
+        values = [v for _, v in results]
+        avg_time, avg_value = sum(times) / len(times), sum(values) / len(values)
+        opt = opt_dic[instance_name]
+        rel_err = Decimal(avg_value / opt - 1).quantize(Decimal("0.0000"), rounding=ROUND_HALF_UP) if opt else ''
+        rows.append({'Dataset': instance_name, 'Algorithm': alg, 'Cutoff': cutoff, 'Runs': len(results),
+                     'Time': round_(avg_time), 'Value': round_(avg_value), 'RelErr': rel_err})
+    write_summary_csv(os.path.join(output_dir, 'summary.csv'), rows)
+    if table_only:
+        return
 
-    plot_list=['large1','large10']    
-    boxplot_dic = {k: [item[0] for item in v] for k, v in plot_dic.items() if k in plot_list}
-    boxplot_(boxplot_dic)    
-    
-    #### Calculate QRTDs ###
-    q_stars = [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
-    for key in plot_list:
-        times = [entry[0] for entry in plot_dic[key]]
-        values = [entry[1] for entry in plot_dic[key]]
-        opt=opt_dic[key]        
-         
-        sorted_indices = np.argsort(times)
-        sorted_times = np.array(times)[sorted_indices]
-        sorted_values = np.array(values)[sorted_indices]             
-        num_runs=len(plot_dic[key])
-        max_time=max(times)        
-                
-        q_thresholds = {q: opt + (q/100)* opt for q in q_stars}        
-        results = {q: [] for q in q_stars} 
-        time_points = np.linspace(0, max_time, 100)
-        
-        for q in q_stars:           
-            threshold = q_thresholds[q]            
-            fractions = []
-
-            for time_point in time_points:                
-                count = 0
-                idx = np.searchsorted(sorted_times, time_point, side='right')
-
-                if idx > 0: 
-                    for i in range(idx):                    
-                        if sorted_values[i] <= threshold: 
-                            count += 1
-                fraction = count / num_runs 
-                                            
-                fractions.append(fraction)          
-            
-            results[q] = list(zip(time_points, fractions))                   
-
-        plot_qrtd(key, results, colors=None)
-
-
-        #### Calculate SQD ###
-        sqd_time_points = [max_time * i / 10 for i in range(1, 11)]  
-        sqd_results = {t: [] for t in sqd_time_points}
-        
-        for time_point in sqd_time_points:
-            q_values = np.linspace(0, 10, 51)  
-            fractions = []
-            
-            for q in q_values:
-                threshold = opt + (q/100) * opt
-                idx = np.searchsorted(sorted_times, time_point, side='right')
-                count = 0
-                
-                if idx > 0:
-                    for i in range(idx):                    
-                        if sorted_values[i] <= threshold:
-                            count += 1
-                
-                fraction = count / num_runs
-                fractions.append(fraction)
-            
-            sqd_results[time_point] = list(zip(q_values, fractions))
-        
-        plot_sqd(key, sqd_results)   
-        
+    ##### figures ####
+    tasks = []
+    figures = defaultdict(list)
+    by_instance = defaultdict(dict)
+    for (instance_name, alg, cutoff), results in sorted(runs.items()):
+        label = f"{instance_name} {alg} {cutoff}s"
+        stem = f"{instance_name}_{alg}_{cutoff}"
+        data = [[t for t, _ in results], [v for _, v in results], opt_dic[instance_name]]
+        tasks.append(('qrtd', label, data, os.path.join(output_dir, f'qrtd_{stem}.png'), dpi))
+        tasks.append(('sqd', label, data, os.path.join(output_dir, f'sqd_{stem}.png'), dpi))
+        by_instance[instance_name][f"{alg}_{cutoff}"] = data[0]
+    for instance_name, boxplot_dic in by_instance.items():
+        tasks.append(('box', instance_name, boxplot_dic, os.path.join(output_dir, f'boxplot_{instance_name}.png'), dpi))
+    for task in tasks:
+        figures[task[1].split()[0]].append(os.path.basename(task[3]))
 
-if __name__ == "__main__":
-    main()
+    cache_path = os.path.join(output_dir, CACHE_FILE)
+    cache = {}
+    if os.path.exists(cache_path):
+        with open(cache_path) as f:
+            cache = json.load(f)
+    hashes = {task[3]: task_hash(task) for task in tasks}
+    todo = [task for task in tasks if cache.get(task[3]) != hashes[task[3]] or not os.path.exists(task[3])]
+    print(f"Rendering {len(todo)} of {len(tasks)} figures ({len(tasks) - len(todo)} unchanged)")
 
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for path in pool.map(render_figure, todo, chunksize=4):
+                cache[path] = hashes[path]
+        with open(cache_path, 'w') as f:
+            json.dump(cache, f)
 
+    write_summary_html(os.path.join(output_dir, 'summary.html'), rows, figures)
 
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Generate the evaluation report')
+    parser.add_argument('-dir', default='.', help='Directory with the .trace and .out files')
+    parser.add_argument('-out', default='report', help='Directory the report is written to')
+    parser.add_argument('-workers', type=int, default=None, help='Number of rendering processes (default: number of CPUs)')
+    parser.add_argument('-table-only', action='store_true', help='Only write summary.csv, without figures or HTML')
+    parser.add_argument('-dpi', type=int, default=DPI, help='Resolution of the figures (default: 300)')
+    return parser.parse_args()
 
+def main():
 
+    """
+    Main function to process trace and optimal solution files, evaluate performance,
+    and generate the comparison table, boxplots, QRTDs, and SQDs as a headless report.
+    """
+    args = parse_arguments()
+    generate_report(args.dir, args.out, args.workers, args.table_only, args.dpi)
+        
 
-    
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
-from typing import List, Set
+from typing import TYPE_CHECKING, List, Set, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class SetCoverInstance:
     def __init__(self, n: int, m: int, subsets: List[Set[int]]):
@@ -36,3 +39,91 @@ def read_instance(filename: str) -> SetCoverInstance:
             subsets.append(subset)
             
         return SetCoverInstance(n, m, subsets)
+
+
+def remove_redundant_subsets(subsets: List[Set[int]], solution: List[int], index_base: int = 1) -> List[int]:
+    """
+    Drop subsets whose elements are all covered by other subsets of the solution.
+
+    Uses per-element coverage counts, so it runs in O(total size of the selected subsets).
+    Subsets are considered for removal in the order they appear in `solution`.
+
+    Args:
+        subsets: List of sets containing elements
+        solution: Indices of the selected subsets
+        index_base: 1 if `solution` holds 1-based indices, 0 for 0-based
+
+    Returns:
+        The solution without redundant subsets, in the original order.
+    """
+    coverage_count = {}
+    for idx in solution:
+        for elem in subsets[idx - index_base]:
+            coverage_count[elem] = coverage_count.get(elem, 0) + 1
+
+    pruned = []
+    for idx in solution:
+        subset = subsets[idx - index_base]
+        if all(coverage_count[elem] > 1 for elem in subset):
+            for elem in subset:
+                coverage_count[elem] -= 1
+        else:
+            pruned.append(idx)
+    return pruned
+
+
+def build_incidence(instance: SetCoverInstance) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray', 'np.ndarray']:
+    """
+    Build compact CSR incidence arrays for a set cover instance.
+
+    Args:
+        instance (SetCoverInstance): The set cover instance.
+
+    Returns:
+        tuple:
+            - subset_ptr (np.ndarray): Offsets of each subset in `subset_elems`, shape (m + 1,).
+            - subset_elems (np.ndarray): 0-based element indices of all subsets concatenated.
+            - elem_ptr (np.ndarray): Offsets of each element in `elem_subsets`, shape (n + 1,).
+            - elem_subsets (np.ndarray): 0-based subset indices containing each element, concatenated.
+    """
+    import numpy as np
+
+    sizes = np.fromiter((len(s) for s in instance.subsets), dtype=np.int64, count=instance.m)
+    subset_ptr = np.zeros(instance.m + 1, dtype=np.int64)
+    np.cumsum(sizes, out=subset_ptr[1:])
+    subset_elems = np.fromiter(
+        (e - 1 for s in instance.subsets for e in sorted(s)), dtype=np.int64, count=int(subset_ptr[-1])
+    )
+
+    # Transpose: group subset ids by element
+    owners = np.repeat(np.arange(instance.m, dtype=np.int64), sizes)
+    order = np.argsort(subset_elems, kind='stable')
+    elem_subsets = owners[order]
+    elem_ptr = np.zeros(instance.n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(subset_elems, minlength=instance.n), out=elem_ptr[1:])
+
+    return subset_ptr, subset_elems, elem_ptr, elem_subsets
+
+
+def gather_rows(ptr: 'np.ndarray', data: 'np.ndarray', rows: 'np.ndarray') -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Gather the CSR rows `rows` into flat arrays without a Python loop.
+
+    Args:
+        ptr (np.ndarray): CSR row offsets.
+        data (np.ndarray): CSR column data.
+        rows (np.ndarray): Rows to gather.
+
+    Returns:
+        tuple:
+            - owner (np.ndarray): Position in `rows` each gathered entry belongs to.
+            - values (np.ndarray): Gathered column data.
+    """
+    import numpy as np
+
+    lengths = ptr[rows + 1] - ptr[rows]
+    owner = np.repeat(np.arange(len(rows)), lengths)
+    starts = np.cumsum(lengths) - lengths
+    offsets = np.arange(int(lengths.sum())) - np.repeat(starts, lengths)
+    values = data[np.repeat(ptr[rows], lengths) + offsets]
+    return owner, values
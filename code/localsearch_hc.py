@@ -1,17 +1,21 @@
 import random
 import time
-from typing import List, Tuple
-from instance import read_instance
+from typing import List, Optional, Tuple
+from instance import SetCoverInstance, read_instance, remove_redundant_subsets
 from approximation import greedy_approximation
+from elite_pool import ElitePool
 
-def run_hill_climbing(instance_path: str, cutoff: int, seed: int) -> Tuple[List[int], int, List[Tuple[float, int]]]:
+def hill_climbing(instance: SetCoverInstance, cutoff: float, seed: int, trace: Optional[list] = None,
+                  initial_solution: Optional[List[int]] = None) -> Tuple[List[int], int, List[Tuple[float, int]]]:
     """
     Runs an improved local search algorithm to solve the Set Cover problem.
 
     Args:
-        instance_path: Path to the input instance file.
+        instance: The set cover instance.
         cutoff: Maximum running time in seconds.
         seed: Random seed for reproducibility.
+        trace: Optional list to append (time, cost) updates to as they happen.
+        initial_solution: Optional feasible cover (1-based indices) to start from instead of the greedy solution.
 
     Returns:
         A tuple containing:
@@ -21,20 +25,27 @@ def run_hill_climbing(instance_path: str, cutoff: int, seed: int) -> Tuple[List[
     """
     random.seed(seed)
     start_time = time.time()
-    instance = read_instance(instance_path)
     print(f"Instance size: {instance.n} elements, {instance.m} subsets")
 
     # Initialize with greedy solution
-    greedy_solution, greedy_cost = greedy_approximation(instance)
+    if initial_solution is None:
+        greedy_solution, greedy_cost = greedy_approximation(instance)
+    else:
+        greedy_solution, greedy_cost = list(initial_solution), len(initial_solution)
     current_solution = greedy_solution.copy()
     current_cost = greedy_cost
     best_solution = current_solution.copy()
     best_cost = current_cost
-    trace = [(0.0, current_cost)]
+    trace = [] if trace is None else trace
+    trace.append((0.0, current_cost))
 
     # Precompute subset coverages
     subset_coverages = [set(s) for s in instance.subsets]
 
+    # Elite covers used as restart points instead of recomputing greedy
+    elite_pool = ElitePool(subset_coverages, seed=seed)
+    elite_pool.add(greedy_solution)
+
     # Maintain coverage count for each element
     coverage_count = [0] * instance.n
     for idx in current_solution:
@@ -70,6 +81,15 @@ def run_hill_climbing(instance_path: str, cutoff: int, seed: int) -> Tuple[List[
             for elem in subset_coverages[add_idx - 1]:
                 coverage_count[elem - 1] += 1
 
+    def reset_coverage(solution):
+        """
+        Rebuilds `coverage_count` from scratch for the given solution.
+        """
+        for i in range(instance.n):
+            coverage_count[i] = 0
+        for idx in solution:
+            update_coverage(add_idx=idx)
+
     while time.time() - start_time < cutoff:
 
         # Calculate exclusive coverage for each subset in solution
@@ -102,6 +122,7 @@ def run_hill_climbing(instance_path: str, cutoff: int, seed: int) -> Tuple[List[
                 best_solution = current_solution.copy()
                 best_cost = current_cost
                 trace.append((time.time() - start_time, best_cost))
+                elite_pool.add(best_solution)
                 no_improve_count = 0
                 swap_size = 1  # Reset swap size
                 print(f"Improved solution: cost={current_cost}")
@@ -141,6 +162,13 @@ def run_hill_climbing(instance_path: str, cutoff: int, seed: int) -> Tuple[List[
 
         # Check if new solution is valid
         uncovered = get_uncovered_elements()
+        if not uncovered:
+            # Drop subsets made redundant by the swap
+            pruned = remove_redundant_subsets(subset_coverages, new_solution)
+            if len(pruned) < current_cost:
+                for idx in set(new_solution) - set(pruned):
+                    update_coverage(remove_idx=idx)
+                new_solution = pruned
         if not uncovered and len(new_solution) < current_cost:
             current_solution = new_solution
             current_cost = len(new_solution)
@@ -148,6 +176,7 @@ def run_hill_climbing(instance_path: str, cutoff: int, seed: int) -> Tuple[List[
                 best_solution = current_solution.copy()
                 best_cost = current_cost
                 trace.append((time.time() - start_time, best_cost))
+                elite_pool.add(best_solution)
                 no_improve_count = 0
                 swap_size = 1  # Reset swap size
                 print(f"Improved solution: cost={current_cost}")
@@ -162,16 +191,12 @@ def run_hill_climbing(instance_path: str, cutoff: int, seed: int) -> Tuple[List[
 
         # Periodic greedy re-optimization
         if no_improve_count % 10 == 0 and no_improve_count > 0:
-            # Remove redundant subsets
+            # Remove redundant subsets, trying them in random order
             temp_solution = current_solution.copy()
             random.shuffle(temp_solution)
-            for idx in temp_solution[:]:
+            temp_solution = remove_redundant_subsets(subset_coverages, temp_solution)
+            for idx in set(current_solution) - set(temp_solution):
                 update_coverage(remove_idx=idx)
-                # For each subset, removes it and checks if the universe is still covered. If covered, keeps it removed; otherwise, re-adds it.
-                if not get_uncovered_elements():
-                    temp_solution.remove(idx)
-                else:
-                    update_coverage(add_idx=idx)
             if len(temp_solution) < current_cost:
                 current_solution = temp_solution
                 current_cost = len(current_solution)
@@ -179,16 +204,18 @@ def run_hill_climbing(instance_path: str, cutoff: int, seed: int) -> Tuple[List[
                     best_solution = current_solution.copy()
                     best_cost = current_cost
                     trace.append((time.time() - start_time, best_cost))
+                    elite_pool.add(best_solution)
                     no_improve_count = 0
                     swap_size = 1
                     print(f"Greedy re-optimization: cost={current_cost}")
 
         if no_improve_count >= no_improve_limit:
-            # Perturb solution by restarting from greedy with small random changes by removing 1,2 element
-            temp_solution, _ = greedy_approximation(instance)
+            # Perturb solution by restarting from an elite cover with small random changes by removing 1,2 element
+            temp_solution = elite_pool.restart()
             if len(temp_solution) > 2:
                 remove_count = random.randint(1, 2)
                 temp_solution = random.sample(temp_solution, len(temp_solution) - remove_count)
+                reset_coverage(temp_solution)
                 uncovered = get_uncovered_elements()
                 for j in random.sample(range(1, instance.m + 1), instance.m):
                     if j not in temp_solution and subset_coverages[j - 1] & uncovered:
@@ -203,11 +230,37 @@ def run_hill_climbing(instance_path: str, cutoff: int, seed: int) -> Tuple[List[
                     no_improve_count = 0
                     swap_size = 1
                     print(f"Perturbed solution: cost={current_cost}")
+                    if current_cost < best_cost:
+                        best_solution = current_solution.copy()
+                        best_cost = current_cost
+                        trace.append((time.time() - start_time, best_cost))
+                        elite_pool.add(best_solution)
+                else:
+                    reset_coverage(current_solution)
 
-        if time.time() - start_time > cutoff - 1:
+        if time.time() - start_time > cutoff - min(1, 0.05 * cutoff):
             print("Approaching cutoff time, stopping search.")
             break
 
     print(f"Best solution: cost={best_cost}")
     print(f"{time.time() - start_time:.2f} seconds elapsed")
-    return best_solution, best_cost, trace
\ No newline at end of file
+    return best_solution, best_cost, trace
+
+
+def run_hill_climbing(instance_path: str, cutoff: int, seed: int) -> Tuple[List[int], int, List[Tuple[float, int]]]:
+    """
+    Runs the hill climbing local search on an instance file.
+
+    Args:
+        instance_path: Path to the input instance file.
+        cutoff: Maximum running time in seconds.
+        seed: Random seed for reproducibility.
+
+    Returns:
+        A tuple containing:
+            - The best solution found (list of 1-based subset indices),
+            - The cost (length) of the best solution,
+            - Trace of (time, cost) for solution updates.
+    """
+    instance = read_instance(instance_path)
+    return hill_climbing(instance, cutoff, seed)
\ No newline at end of file
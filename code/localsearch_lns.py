@@ -0,0 +1,142 @@
+import random
+import time
+from typing import List, Optional, Tuple
+from instance import SetCoverInstance, read_instance, remove_redundant_subsets
+from approximation import greedy_approximation
+from bnb import branch_and_bound
+
+
+def large_neighborhood_search(instance: SetCoverInstance, cutoff: float, seed: int,
+                              trace: Optional[list] = None) -> Tuple[List[int], int, List[Tuple[float, int]]]:
+    """
+    Large Neighborhood Search with exact repairs by branch and bound.
+
+    Each iteration destroys a region of the current cover: the selected subsets containing a random
+    element, grown through selected subsets that share elements with them. The elements left
+    uncovered form a residual sub-instance over every subset that touches them, which is re-solved
+    with a time-capped `branch_and_bound`. Repairs that are no larger than the destroyed region are
+    accepted. The region grows while sub-solves finish early and shrinks when they hit the time cap.
+
+    Args:
+        instance: The set cover instance.
+        cutoff: Maximum running time in seconds.
+        seed: Random seed for reproducibility.
+        trace: Optional list to append (time, cost) updates to as they happen.
+
+    Returns:
+        A tuple containing:
+            - The best solution found (list of 1-based subset indices),
+            - The cost (length) of the best solution,
+            - Trace of (time, cost) for solution updates.
+    """
+    random.seed(seed)
+    start_time = time.time()
+
+    current_solution, current_cost = greedy_approximation(instance)
+    best_solution = current_solution.copy()
+    best_cost = current_cost
+    trace = [] if trace is None else trace
+    trace.append((0.0, best_cost))
+
+    # containing[e - 1]: 1-based indices of the subsets that contain element e
+    containing = [[] for _ in range(instance.n)]
+    for idx, subset in enumerate(instance.subsets, start=1):
+        for elem in subset:
+            containing[elem - 1].append(idx)
+
+    destroy_size = 4
+    min_destroy, max_destroy = 2, 30
+    sub_cutoff = 0.5
+
+    while time.time() - start_time < cutoff:
+        selected = set(current_solution)
+
+        # Destroy: grow a connected region of selected subsets around a random element
+        elem = random.randint(1, instance.n)
+        region = [idx for idx in containing[elem - 1] if idx in selected]
+        frontier = list(region)
+        random.shuffle(frontier)
+        while frontier and len(region) < destroy_size:
+            idx = frontier.pop()
+            for e in instance.subsets[idx - 1]:
+                for j in containing[e - 1]:
+                    if j in selected and j not in region and len(region) < destroy_size:
+                        region.append(j)
+                        frontier.append(j)
+        if not region:
+            continue
+
+        kept = selected.difference(region)
+        residual = set()
+        for idx in region:
+            residual |= instance.subsets[idx - 1]
+        for idx in kept:
+            residual -= instance.subsets[idx - 1]
+            if not residual:
+                break
+
+        if not residual:
+            # The whole region was redundant
+            new_solution = list(kept)
+        else:
+            # Residual sub-instance: every subset restricted to the residual elements, duplicates dropped
+            candidates = {}
+            for e in residual:
+                for j in containing[e - 1]:
+                    if j not in candidates:
+                        candidates[j] = frozenset(instance.subsets[j - 1] & residual)
+            unique = {}
+            for j, restricted in candidates.items():
+                unique.setdefault(restricted, j)
+            # branch_and_bound branches on subsets in index order, so offer the largest first
+            order = sorted(unique, key=len, reverse=True)
+            ids = [unique[restricted] for restricted in order]
+            sets = [set(restricted) for restricted in order]
+
+            remaining = cutoff - (time.time() - start_time)
+            budget = min(sub_cutoff, remaining)
+            if budget <= 0:
+                break
+            sub_start = time.time()
+            sub_solution, sub_cost, _ = branch_and_bound(residual, sets, budget)
+            timed_out = time.time() - sub_start >= 0.95 * budget
+
+            if timed_out:
+                destroy_size = max(min_destroy, destroy_size - 1)
+            else:
+                destroy_size = min(max_destroy, destroy_size + 1)
+
+            if sub_cost > len(region):
+                continue
+            new_solution = list(kept) + [ids[i - 1] for i in sub_solution]
+
+        new_solution = remove_redundant_subsets(instance.subsets, new_solution)
+        current_solution = new_solution
+        current_cost = len(new_solution)
+        if current_cost < best_cost:
+            best_solution = current_solution.copy()
+            best_cost = current_cost
+            trace.append((time.time() - start_time, best_cost))
+            print(f"Improved solution: cost={best_cost}")
+
+    print(f"Best solution: cost={best_cost}")
+    return best_solution, best_cost, trace
+
+
+def run_large_neighborhood_search(instance_path: str, cutoff: int, seed: int) -> Tuple[List[int], int, List[Tuple[float, int]]]:
+    """
+    Runs Large Neighborhood Search on an instance file.
+
+    Args:
+        instance_path: Path to the input instance file.
+        cutoff: Maximum running time in seconds.
+        seed: Random seed for reproducibility.
+
+    Returns:
+        A tuple containing:
+            - The best solution found (list of 1-based subset indices),
+            - The cost (length) of the best solution,
+            - Trace of (time, cost) for solution updates.
+    """
+    instance = read_instance(instance_path)
+    return large_neighborhood_search(instance, cutoff, seed)
@@ -6,8 +6,9 @@
 import time
 import random
 import math
-from instance import read_instance
-from typing import List, Tuple
+from instance import SetCoverInstance, read_instance, remove_redundant_subsets
+from elite_pool import ElitePool
+from typing import List, Optional, Tuple
 
 
 def solve_approximation(universe, subsets):
@@ -46,7 +47,7 @@ def solve_approximation(universe, subsets):
 
 
 
-def run_simulated_annealing(instance_path: str, cutoff: int, seed: int) -> Tuple[List[int], int, List[Tuple[float, int]]]:
+def simulated_annealing(instance: SetCoverInstance, cutoff: float, seed: int, trace: Optional[list] = None) -> Tuple[List[int], int, List[Tuple[float, int]]]:
     """
     Local Search 2: Simulated Annealing
 
@@ -55,26 +56,25 @@ def run_simulated_annealing(instance_path: str, cutoff: int, seed: int) -> Tuple
     probabilistically accepting worse solutions to escape local minima, with 
     the probability decreasing as the temperature cools.
 
-    Moreover, it will restart when the current cost is much worse than the previous best solution ever found.
+    Moreover, it will restart from an elite solution (see `ElitePool`) when the current cost is much worse
+    than the previous best solution ever found.
 
     Args:
-        time_limit (float): Time limit in seconds for the algorithm to run.
+        instance (SetCoverInstance): The set cover instance.
+        cutoff (float): Time limit in seconds for the algorithm to run.
         seed (int): Random seed for reproducibility.
-        universe (set): The set of all elements that need to be covered.
-        subsets (list of sets): List of candidate subsets that can be selected to cover the universe.
-        initial_cost (int): Cost (number of subsets used) of the initial solution.
-        initial_solution (list of int): List of indices of subsets forming the initial solution.
+        trace (list, optional): List to append (time, cost) updates to as they happen.
 
     Returns:
         tuple:
-            - best_solution (list of int): Indices of subsets selected in the best found solution.
+            - best_solution (list of int): 1-based indices of subsets selected in the best found solution.
+            - best_cost (int): Number of subsets in the best found solution.
             - trace (list of tuples): A list of (time, cost) tuples tracking the best cost achieved over time.
     """
     random.seed(seed)    
 
     start_time = time.time()
-    trace = []
-    instance = read_instance(instance_path)
+    trace = [] if trace is None else trace
     universe = instance.universe.copy()
     subsets = instance.subsets.copy()
     initial_cost, initial_solution = solve_approximation(universe, subsets)
@@ -84,6 +84,9 @@ def run_simulated_annealing(instance_path: str, cutoff: int, seed: int) -> Tuple
     best_solution = current_solution.copy()
     best_cost = current_cost
 
+    elite_pool = ElitePool(subsets, seed=seed, index_base=0)
+    elite_pool.add(initial_solution)
+
     trace.append((0, best_cost))
 
     initial_temp = 1.0
@@ -114,18 +117,21 @@ def run_simulated_annealing(instance_path: str, cutoff: int, seed: int) -> Tuple
                 uncovered -= subsets[best_idx]
                 available_indices.remove(best_idx)
 
+            neighbor = set(remove_redundant_subsets(subsets, list(neighbor), index_base=0))
             neighbor_cost = len(neighbor)            
             delta_from_best = neighbor_cost - best_cost
             delta_from_neighbor = neighbor_cost - current_cost
 
             if delta_from_best/best_cost >=0.5:
-                current_solution = set(initial_solution)
-                current_cost = initial_cost
+                current_solution = set(elite_pool.restart())
+                current_cost = len(current_solution)
             
             else:
                 if delta_from_neighbor < 0 or random.random() < math.exp(-delta_from_neighbor / temp):
                     current_solution = neighbor
                     current_cost = neighbor_cost
+                    if current_cost <= best_cost:
+                        elite_pool.add(current_solution)
                     if current_cost < best_cost:
                         best_solution = current_solution.copy()
                         best_cost = current_cost
@@ -134,4 +140,23 @@ def run_simulated_annealing(instance_path: str, cutoff: int, seed: int) -> Tuple
 
         temp *= alpha       
 
-    return list(best_solution), len(list(best_solution)),  trace
\ No newline at end of file
+    return [i + 1 for i in best_solution], len(list(best_solution)),  trace
+
+
+def run_simulated_annealing(instance_path: str, cutoff: int, seed: int) -> Tuple[List[int], int, List[Tuple[float, int]]]:
+    """
+    Run Simulated Annealing on an instance file.
+
+    Args:
+        instance_path (str): Path to the file containing the set cover instance.
+        cutoff (int): Time limit in seconds for the algorithm to run.
+        seed (int): Random seed for reproducibility.
+
+    Returns:
+        tuple:
+            - best_solution (list of int): 1-based indices of subsets selected in the best found solution.
+            - best_cost (int): Number of subsets in the best found solution.
+            - trace (list of tuples): A list of (time, cost) tuples tracking the best cost achieved over time.
+    """
+    instance = read_instance(instance_path)
+    return simulated_annealing(instance, cutoff, seed)
\ No newline at end of file
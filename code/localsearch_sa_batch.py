@@ -0,0 +1,209 @@
+####################################################
+#### Local Search - Batched Simulated Annealing ####
+####################################################
+
+
+import time
+import numpy as np
+from instance import SetCoverInstance, read_instance, remove_redundant_subsets, build_incidence, gather_rows
+from localsearch_sa import solve_approximation
+from typing import List, Optional, Tuple
+
+
+def group_rank(owner: np.ndarray) -> np.ndarray:
+    """Position of every entry within its run of equal values in the sorted array `owner`."""
+    return np.arange(len(owner)) - np.searchsorted(owner, owner)
+
+
+def batched_simulated_annealing(instance: SetCoverInstance, cutoff: float, seed: int, chains: int = 32,
+                                tempering: bool = False,
+                                trace: Optional[list] = None) -> Tuple[List[int], int, List[Tuple[float, int]]]:
+    """
+    Simulated Annealing advancing many independent chains in lockstep.
+
+    Every chain keeps a coverage count row in a (chains, n) integer array, plus the list of its
+    selected subsets and the list of its uncovered elements with the position of every entry, so one
+    NumPy step performs one move on all chains at once. A feasible chain proposes removing a random
+    selected subset, an infeasible chain proposes adding a subset that covers a random uncovered
+    element. Moves are scored with energy = cost + #uncovered and accepted with the Metropolis
+    criterion. Sampling from the lists and updating them only touches the flipped subsets, so a
+    step costs O(chains + size of the flipped subsets) rather than O(chains * (m + n)).
+
+    In the default mode every chain follows the same geometric cooling schedule and reheats once it
+    reaches the final temperature. With `tempering` the chains sit on a fixed temperature ladder and
+    adjacent temperatures are periodically exchanged (parallel tempering).
+
+    Args:
+        instance (SetCoverInstance): The set cover instance.
+        cutoff (float): Time limit in seconds.
+        seed (int): Random seed for reproducibility.
+        chains (int): Number of chains advanced together.
+        tempering (bool): Use parallel tempering instead of independent cooling chains.
+        trace (list, optional): List to append (time, cost) updates to as they happen.
+
+    Returns:
+        tuple:
+            - best_solution (list of int): 1-based indices of the best feasible cover over all chains.
+            - best_cost (int): Number of subsets in the best cover.
+            - trace (list of tuples): (time, cost) for every improvement of the best cover.
+    """
+    if chains < 1:
+        raise ValueError("chains must be at least 1")
+
+    rng = np.random.default_rng(seed)
+    start_time = time.time()
+
+    initial_temp = 1.0
+    final_temp = 0.01
+    alpha = 0.95
+    steps_per_temp = 1000
+    swap_interval = 100
+
+    subset_ptr, subset_elems, elem_ptr, elem_subsets = build_incidence(instance)
+    chain_ids = np.arange(chains)
+
+    # All chains start from the greedy cover, the random moves diversify them
+    initial_cost, initial_solution = solve_approximation(instance.universe, instance.subsets)
+    initial = np.array(initial_solution, dtype=np.int64)
+    coverage = np.zeros((chains, instance.n), dtype=np.int32)
+    _, initial_elems = gather_rows(subset_ptr, subset_elems, initial)
+    np.add.at(coverage[0], initial_elems, 1)
+    coverage[1:] = coverage[0]
+    cost = np.full(chains, initial_cost, dtype=np.int64)
+
+    # members[c, :cost[c]] lists the subsets selected by chain c, member_pos[c, s] is the position
+    # of subset s in that list or -1; holes and hole_pos do the same for the uncovered elements.
+    members = np.zeros((chains, instance.m), dtype=np.int64)
+    members[:, :initial_cost] = initial
+    member_pos = np.full((chains, instance.m), -1, dtype=np.int64)
+    member_pos[:, initial] = np.arange(initial_cost)
+    initial_holes = np.flatnonzero(coverage[0] == 0)
+    uncovered = np.full(chains, len(initial_holes), dtype=np.int64)
+    holes = np.zeros((chains, instance.n), dtype=np.int64)
+    holes[:, :len(initial_holes)] = initial_holes
+    hole_pos = np.full((chains, instance.n), -1, dtype=np.int64)
+    hole_pos[:, initial_holes] = np.arange(len(initial_holes))
+
+    best_solution = remove_redundant_subsets(instance.subsets, sorted(i + 1 for i in initial_solution))
+    best_cost = len(best_solution)
+    trace = [] if trace is None else trace
+    trace.append((0.0, best_cost))
+
+    if tempering:
+        ladder_temps = np.geomspace(initial_temp, final_temp, chains)
+        ladder = chain_ids.copy()  # ladder[k] is the chain currently at ladder_temps[k]
+        temps = ladder_temps.copy()
+    else:
+        temps = np.full(chains, initial_temp)
+
+    step = 0
+    while time.time() - start_time < cutoff:
+        step += 1
+
+        # Propose one flip per chain: a random selected subset, or a subset covering a random hole
+        is_add = uncovered > 0
+        movable = is_add | (cost > 0)
+        flip = members[chain_ids, (rng.random(chains) * cost).astype(np.int64)]
+        adders = chain_ids[is_add]
+        if len(adders):
+            target = holes[adders, (rng.random(len(adders)) * uncovered[adders]).astype(np.int64)]
+            degree = elem_ptr[target + 1] - elem_ptr[target]
+            flip[adders] = elem_subsets[elem_ptr[target] + (rng.random(len(target)) * degree).astype(np.int64)]
+
+        # Score the flips from the coverage counts of the touched elements
+        owner, elems = gather_rows(subset_ptr, subset_elems, flip)
+        counts = coverage[owner, elems]
+        newly = np.bincount(owner, weights=(counts == 0), minlength=chains)
+        exclusive = np.bincount(owner, weights=(counts == 1), minlength=chains)
+        delta = np.where(is_add, 1.0 - newly, exclusive - 1.0)
+
+        accept = movable & ((delta <= 0) | (rng.random(chains) < np.exp(-np.maximum(delta, 0) / temps)))
+
+        # Apply accepted moves to the coverage counts
+        sign = np.where(is_add, 1, -1)
+        hit = accept[owner]
+        owner, elems, counts = owner[hit], elems[hit], counts[hit]
+        coverage[owner, elems] += sign[owner]
+
+        # Selected lists: append added subsets, swap removed subsets with the last entry
+        added = chain_ids[accept & is_add]
+        members[added, cost[added]] = flip[added]
+        member_pos[added, flip[added]] = cost[added]
+        removed = chain_ids[accept & ~is_add]
+        slot = member_pos[removed, flip[removed]]
+        last = members[removed, cost[removed] - 1]
+        members[removed, slot] = last
+        member_pos[removed, last] = slot
+        member_pos[removed, flip[removed]] = -1
+        cost[accept] += sign[accept]
+
+        # Holes opened by removals are appended
+        opened = ~is_add[owner] & (counts == 1)
+        if opened.any():
+            o, e = owner[opened], elems[opened]
+            slot = uncovered[o] + group_rank(o)
+            holes[o, slot] = e
+            hole_pos[o, e] = slot
+
+        # Holes closed by additions are dropped: the k closed holes of a chain free its last k slots,
+        # and the surviving holes stored in those tail slots move into the freed slots below the tail
+        closed = is_add[owner] & (counts == 0)
+        if closed.any():
+            o, e = owner[closed], elems[closed]
+            new_length = uncovered[o] - np.bincount(o, minlength=chains)[o]
+            slot = hole_pos[o, e]
+            hole_pos[o, e] = -1
+            tail = holes[o, new_length + group_rank(o)]
+            keep = hole_pos[o, tail] >= 0
+            gap = slot < new_length
+            holes[o[gap], slot[gap]] = tail[keep]
+            hole_pos[o[gap], tail[keep]] = slot[gap]
+
+        uncovered[accept] += np.where(is_add, -newly, exclusive).astype(np.int64)[accept]
+
+        # Track the best feasible cover across all chains
+        feasible_cost = np.where(uncovered == 0, cost, np.iinfo(np.int64).max)
+        leader = int(feasible_cost.argmin())
+        if feasible_cost[leader] < best_cost:
+            best_solution = remove_redundant_subsets(instance.subsets, sorted(members[leader, :cost[leader]] + 1))
+            best_cost = len(best_solution)
+            trace.append((time.time() - start_time, best_cost))
+
+        # Temperature control
+        if tempering:
+            if step % swap_interval == 0:
+                energy = cost + uncovered
+                parity = (step // swap_interval) % 2
+                low = np.arange(parity, chains - 1, 2)
+                a, b = ladder[low], ladder[low + 1]
+                log_p = (energy[a] - energy[b]) * (1.0 / ladder_temps[low] - 1.0 / ladder_temps[low + 1])
+                swap = np.log(rng.random(len(low)) + 1e-300) < log_p
+                ladder[low[swap]], ladder[low[swap] + 1] = b[swap], a[swap]
+                temps[ladder] = ladder_temps
+        elif step % steps_per_temp == 0:
+            temps *= alpha
+            temps[temps < final_temp] = initial_temp
+
+    return best_solution, best_cost, trace
+
+
+def run_batched_simulated_annealing(instance_path: str, cutoff: int, seed: int, chains: int = 32,
+                                    tempering: bool = False) -> Tuple[List[int], int, List[Tuple[float, int]]]:
+    """
+    Local Search 2 (batched): run many Simulated Annealing chains in one process.
+
+    Args:
+        instance_path (str): Path to the file containing the set cover instance.
+        cutoff (int): Time limit in seconds.
+        seed (int): Random seed for reproducibility.
+        chains (int): Number of chains advanced together.
+        tempering (bool): Use parallel tempering instead of independent cooling chains.
+
+    Returns:
+        tuple:
+            - best_solution (list of int): 1-based indices of the subsets in the best cover.
+            - best_cost (int): Number of subsets in the best cover.
+            - trace (list of tuples): (time, cost) for every improvement of the best cover.
+    """
+    instance = read_instance(instance_path)
+    return batched_simulated_annealing(instance, cutoff, seed, chains, tempering)
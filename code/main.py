@@ -1,10 +1,7 @@
 import argparse
 import sys
 from typing import List, Tuple
-from localsearch_hc import run_hill_climbing
-from approximation import run_approximation
-from localsearch_sa import run_simulated_annealing
-from bnb import run_branch_and_bound
+from algorithms import ALGORITHMS
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -19,8 +16,8 @@ def parse_arguments():
     parser.add_argument(
         '-alg',
         required=True,
-        choices=['BnB', 'Approx', 'LS1', 'LS2'],
-        help='Algorithm to use: Branch and Bound, Approximation, Local Search 1, or Local Search 2'
+        choices=list(ALGORITHMS),
+        help='Algorithm to use: Branch and Bound, Approximation, Local Search 1, Local Search 2, batched Local Search 2, or Large Neighborhood Search'
     )
     
     parser.add_argument(
@@ -36,12 +33,43 @@ def parse_arguments():
         required=True,
         help='Random seed for reproducibility'
     )
+
+    parser.add_argument(
+        '-chains',
+        type=int,
+        default=32,
+        help='Number of Simulated Annealing chains run together by LS2B'
+    )
+
+    parser.add_argument(
+        '-tempering',
+        action='store_true',
+        help='Use parallel tempering across the LS2B chains'
+    )
+
+    parser.add_argument(
+        '-decompose',
+        action='store_true',
+        help='Solve each connected component of the instance separately in parallel worker processes'
+    )
+
+    parser.add_argument(
+        '-workers',
+        type=int,
+        default=None,
+        help='Number of worker processes used with -decompose (default: number of CPUs), or by BnB alone to run parallel branch and bound'
+    )
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.chains < 1:
+        parser.error('-chains must be at least 1')
+    if args.workers is not None and args.workers < 1:
+        parser.error('-workers must be at least 1')
+    return args
 
 def get_output_filename(instance_name: str, algorithm: str, cutoff: int, seed: int, ext: str) -> str:
     """Generate output filename in required format."""
-    if algorithm == 'Approx' or algorithm == 'BnB':
+    if algorithm in ALGORITHMS and not ALGORITHMS[algorithm].seeded:
         return f"{instance_name}_{algorithm}_{cutoff}.{ext}"
     else:
         return f"{instance_name}_{algorithm}_{cutoff}_{seed}.{ext}"
@@ -59,21 +87,24 @@ def main():
         trace_file = get_output_filename(instance_name, args.alg, args.time, args.seed, "trace")
         
         # Select and run algorithm
-        if args.alg == 'BnB':
-            solution, cost, trace = run_branch_and_bound(args.inst, args.time)
-        elif args.alg == 'Approx':
-            solution, cost = run_approximation(args.inst)
-        elif args.alg == 'LS1':
-            solution, cost, trace = run_hill_climbing(args.inst, args.time, args.seed)
-        elif args.alg == 'LS2':
-            solution, cost, trace = run_simulated_annealing(args.inst, args.time, args.seed)
-        else: 
-            raise ValueError("Invalid algorithm specified. Please choose from: BnB, Approx, LS1, LS2.")
+        algorithm = ALGORITHMS.get(args.alg)
+        if algorithm is None:
+            raise ValueError(f"Invalid algorithm specified. Please choose from: {', '.join(ALGORITHMS)}.")
+        if args.decompose:
+            from instance import read_instance
+            from decompose import solve_decomposed
+            options = {'chains': args.chains, 'tempering': args.tempering} if args.alg == 'LS2B' else {}
+            solution, cost, trace = solve_decomposed(read_instance(args.inst), args.alg, args.time, args.seed,
+                                                     args.workers, **options)
+        elif algorithm.writes_trace:
+            solution, cost, trace = algorithm.load()(*algorithm.arguments(args))
+        else:
+            solution, cost = algorithm.load()(*algorithm.arguments(args))
             
             
         # Write solution and trace files
         write_solution(sol_file, solution, cost)
-        if args.alg != 'Approx':
+        if algorithm.writes_trace:
             write_trace(trace_file, trace)
         
     except Exception as e:
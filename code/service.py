@@ -0,0 +1,322 @@
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from instance import SetCoverInstance, read_instance
+from algorithms import ALGORITHMS
+from decompose import solve_instance
+
+# Job processes are forked so they inherit the imported solvers and the cached instance instead of
+# re-importing them and unpickling the instance, which spawn/forkserver (the default on macOS and on
+# Linux from Python 3.14) would do for every job.
+_CONTEXT = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else None)
+
+
+class StreamingTrace(list):
+    """Trace list that also forwards every appended (time, cost) entry to a queue."""
+
+    def __init__(self, channel):
+        super().__init__()
+        self.channel = channel
+
+    def append(self, entry):
+        super().append(entry)
+        self.channel.put(('trace', float(entry[0]), int(entry[1])))
+
+
+def _run_job(instance: SetCoverInstance, algorithm: str, cutoff: float, seed: int, options: dict, channel):
+    """Worker process entry point: solve and report trace updates and the final cover on `channel`."""
+    try:
+        solution, cost, _ = solve_instance(instance, algorithm, cutoff, seed, StreamingTrace(channel), **options)
+        channel.put(('done', [int(i) for i in solution], int(cost)))
+    except Exception as e:
+        channel.put(('error', f"{type(e).__name__}: {e}"))
+
+
+class SolverService:
+    def __init__(self, max_workers: int = None, cache_size: int = 16, grace: float = 5.0):
+        """
+        Long-running solver that keeps parsed instances in memory.
+
+        Each job runs in its own worker process so it can be cancelled or stopped at its deadline;
+        at most `max_workers` jobs run at the same time, the others wait in a queue.
+
+        Args:
+            max_workers: Maximum number of jobs running at once (defaults to the number of CPUs)
+            cache_size: Number of parsed instances kept in the LRU cache
+            grace: Seconds a job may run past its cutoff before it is killed
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache_size = cache_size
+        self.grace = grace
+        self.instances: "OrderedDict[Tuple[str, float], SetCoverInstance]" = OrderedDict()
+        self.jobs: Dict[int, multiprocessing.Process] = {}
+        self.job_ids = itertools.count(1)
+        self.slots: Optional[asyncio.Semaphore] = None
+
+    async def get_instance(self, path: str) -> SetCoverInstance:
+        """
+        Return the parsed instance for `path`, re-reading it only if the file changed.
+
+        Parsing runs in a thread so a large instance does not stall the other clients' streams.
+        """
+        key = (os.path.abspath(path), os.path.getmtime(path))
+        if key in self.instances:
+            self.instances.move_to_end(key)
+            return self.instances[key]
+
+        instance = await asyncio.get_running_loop().run_in_executor(None, read_instance, path)
+        self.instances[key] = instance
+        if len(self.instances) > self.cache_size:
+            self.instances.popitem(last=False)
+        return instance
+
+    def parse_request(self, request: dict) -> Tuple[str, str, float, int, dict, float]:
+        """
+        Validate a solve request.
+
+        Returns:
+            Instance path, algorithm, cutoff, seed, solver options and deadline.
+
+        Raises:
+            ValueError: If a field is missing or has an invalid value.
+        """
+        missing = [key for key in ('inst', 'alg', 'time') if key not in request]
+        if missing:
+            raise ValueError(f"Missing field(s): {', '.join(missing)}")
+        algorithm = request['alg']
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}. Please choose from: {', '.join(ALGORITHMS)}.")
+        options = request.get('options', {})
+        if not isinstance(options, dict):
+            raise ValueError("options must be an object")
+        try:
+            cutoff = float(request['time'])
+            seed = int(request.get('seed', 0))
+            deadline = float(request.get('deadline', cutoff + self.grace))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid number: {e}")
+        return str(request['inst']), algorithm, cutoff, seed, options, deadline
+
+    async def solve(self, request: dict, send):
+        """
+        Run one solve job and stream its events through `send`.
+
+        Events are dicts with an "event" key: "queued", "started", "trace" (time, cost),
+        then one of "done" (solution, cost), "error", "cancelled" or "timeout".
+        Every job ends with exactly one of the last four, even if the service itself fails.
+        """
+        job = next(self.job_ids)
+        try:
+            await self._solve(job, request, send)
+        except ConnectionError:
+            pass  # client went away, `handle` cleans up
+        except Exception as e:
+            await send({'event': 'error', 'job': job, 'message': f"{type(e).__name__}: {e}"})
+
+    async def _solve(self, job: int, request: dict, send):
+        try:
+            path, algorithm, cutoff, seed, options, deadline = self.parse_request(request)
+            instance = await self.get_instance(path)
+        except (OSError, ValueError) as e:
+            await send({'event': 'error', 'job': job, 'message': str(e)})
+            return
+
+        await send({'event': 'queued', 'job': job})
+        async with self.slots:
+            channel = _CONTEXT.Queue()
+            process = _CONTEXT.Process(
+                target=_run_job, args=(instance, algorithm, cutoff, seed, options, channel), daemon=True
+            )
+            process.start()
+            self.jobs[job] = process
+            start_time = time.time()
+            await send({'event': 'started', 'job': job})
+
+            loop = asyncio.get_running_loop()
+            try:
+                while True:
+                    if time.time() - start_time > deadline:
+                        await send({'event': 'timeout', 'job': job})
+                        break
+                    message = await loop.run_in_executor(None, _poll, channel, 0.1)
+                    if message is None:
+                        if not process.is_alive() and channel.empty():
+                            await send({'event': 'cancelled' if process.exitcode < 0 else 'error', 'job': job})
+                            break
+                        continue
+                    if message[0] == 'trace':
+                        await send({'event': 'trace', 'job': job, 'time': message[1], 'cost': message[2]})
+                    elif message[0] == 'done':
+                        await send({'event': 'done', 'job': job, 'solution': message[1], 'cost': message[2]})
+                        break
+                    else:
+                        await send({'event': 'error', 'job': job, 'message': message[1]})
+                        break
+            finally:
+                self.jobs.pop(job, None)
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+    def cancel(self, job: int) -> bool:
+        """Kill a running job. Its client receives a "cancelled" event."""
+        process = self.jobs.get(job) if isinstance(job, int) else None
+        if process is None or not process.is_alive():
+            return False
+        process.terminate()
+        return True
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Serve one client connection.
+
+        The protocol is one JSON object per line in both directions. Requests:
+            {"op": "solve", "inst": ..., "alg": ..., "time": ..., "seed": ..., "deadline": ..., "options": {...}}
+            {"op": "cancel", "job": ...}
+        """
+        async def send(message):
+            writer.write((json.dumps(message) + "\n").encode())
+            await writer.drain()
+
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as e:
+                    await send({'event': 'error', 'message': f"Invalid request: {e}"})
+                    continue
+                if not isinstance(request, dict):
+                    await send({'event': 'error', 'message': "Invalid request: expected a JSON object"})
+                    continue
+
+                op = request.get('op')
+                if op == 'solve':
+                    task = asyncio.create_task(self.solve(request, send))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                elif op == 'cancel':
+                    await send({'event': 'cancel', 'job': request.get('job'), 'ok': self.cancel(request.get('job'))})
+                else:
+                    await send({'event': 'error', 'message': f"Unknown op: {op}"})
+            if tasks:
+                await asyncio.gather(*tasks)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            # Client went away: stop its jobs
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def serve(self, socket_path: str = None, host: str = '127.0.0.1', port: int = 8765):
+        """
+        Listen on a Unix socket if `socket_path` is given, otherwise on host:port.
+
+        Every registered solver is imported up front, so forked jobs start without importing anything.
+        """
+        for algorithm in ALGORITHMS.values():
+            algorithm.load_solver()
+        self.slots = asyncio.Semaphore(self.max_workers)
+        if socket_path:
+            server = await asyncio.start_unix_server(self.handle, path=socket_path)
+            print(f"Listening on {socket_path}")
+        else:
+            server = await asyncio.start_server(self.handle, host, port)
+            print(f"Listening on {host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+
+def _poll(channel, timeout: float):
+    """Blocking queue read with timeout, returning None when nothing arrived."""
+    try:
+        return channel.get(timeout=timeout)
+    except queue.Empty:
+        return None
+
+
+async def request_solve(request: dict, socket_path: str = None, host: str = '127.0.0.1', port: int = 8765):
+    """
+    Send one solve request to a running service and yield its events until the job finishes.
+    """
+    if socket_path:
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write((json.dumps(dict(request, op='solve')) + "\n").encode())
+        await writer.drain()
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            event = json.loads(line)
+            yield event
+            if event['event'] not in ('queued', 'started', 'trace'):
+                break
+    finally:
+        writer.close()
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Set Cover solver service')
+    parser.add_argument('mode', choices=['serve', 'solve'], help='Run the service, or send it one solve job')
+    parser.add_argument('-socket', help='Unix socket path (default: listen on localhost TCP)')
+    parser.add_argument('-port', type=int, default=8765, help='Localhost TCP port')
+    parser.add_argument('-workers', type=int, default=None, help='Maximum number of jobs running at once')
+    parser.add_argument('-cache', type=int, default=16, help='Number of parsed instances kept in memory')
+    parser.add_argument('-inst', help='Path to the instance file (solve mode)')
+    parser.add_argument('-alg', choices=list(ALGORITHMS), help='Algorithm (solve mode)')
+    parser.add_argument('-time', type=int, help='Cutoff time in seconds (solve mode)')
+    parser.add_argument('-seed', type=int, default=0, help='Random seed (solve mode)')
+    return parser.parse_args()
+
+
+async def _client(args):
+    """Send one job, print trace improvements as they arrive and write the usual .sol/.trace files."""
+    from main import get_output_filename, write_solution, write_trace
+
+    request = {'inst': os.path.abspath(args.inst), 'alg': args.alg, 'time': args.time, 'seed': args.seed}
+    trace = []
+    async for event in request_solve(request, args.socket, port=args.port):
+        if event['event'] == 'trace':
+            print(f"{event['time']:.2f} {event['cost']}")
+            trace.append((event['time'], event['cost']))
+        elif event['event'] == 'done':
+            instance_name = args.inst.split('/')[-1].split('.')[0]
+            write_solution(get_output_filename(instance_name, args.alg, args.time, args.seed, "sol"),
+                           event['solution'], event['cost'])
+            if ALGORITHMS[args.alg].writes_trace:
+                write_trace(get_output_filename(instance_name, args.alg, args.time, args.seed, "trace"), trace)
+        elif event['event'] not in ('queued', 'started'):
+            print(f"Error: {event}", file=sys.stderr)
+            sys.exit(1)
+
+
+def main():
+    args = parse_arguments()
+    if args.mode == 'serve':
+        service = SolverService(args.workers, args.cache)
+        try:
+            asyncio.run(service.serve(args.socket, port=args.port))
+        except KeyboardInterrupt:
+            pass
+    else:
+        asyncio.run(_client(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import argparse
+import glob
+import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+import numpy as np
+from instance import read_instance, build_incidence, gather_rows
+
+# Per-process cache: instance path -> (n, m, subset_ptr, subset_elems)
+_incidence_cache: Dict[str, Tuple[int, int, np.ndarray, np.ndarray]] = {}
+
+BATCH_SIZE = 64
+
+
+def load_incidence(instance_path: str) -> Tuple[int, int, np.ndarray, np.ndarray]:
+    """Parse an instance once per process and keep only its CSR incidence arrays."""
+    if instance_path not in _incidence_cache:
+        instance = read_instance(instance_path)
+        subset_ptr, subset_elems, _, _ = build_incidence(instance)
+        _incidence_cache[instance_path] = (instance.n, instance.m, subset_ptr, subset_elems)
+    return _incidence_cache[instance_path]
+
+
+def read_solution(filename: str) -> Tuple[int, np.ndarray]:
+    """Read a .sol file written by main.write_solution: cost line, then the subset indices."""
+    with open(filename, 'r') as f:
+        cost = int(f.readline().split()[0])
+        indices = np.array(f.read().split(), dtype=np.int64)
+    return cost, indices
+
+
+def verify_batch(instance_path: str, sol_files: List[str]) -> List[Tuple[str, List[str]]]:
+    """
+    Check a batch of .sol files against one instance.
+
+    Coverage of the whole batch is counted with a single bincount over (file, element) pairs.
+
+    Returns:
+        (file, problems) for every file; an empty problem list means the file is valid.
+    """
+    n, m, subset_ptr, subset_elems = load_incidence(instance_path)
+
+    problems = []
+    rows = []
+    for filename in sol_files:
+        issues = []
+        try:
+            cost, indices = read_solution(filename)
+        except (OSError, ValueError, IndexError) as e:
+            problems.append((filename, [f"unreadable: {e}"]))
+            rows.append(np.empty(0, dtype=np.int64))
+            continue
+
+        if cost != len(indices):
+            issues.append(f"cost mismatch: header {cost}, {len(indices)} indices")
+        unique, counts = np.unique(indices, return_counts=True)
+        if (counts > 1).any():
+            issues.append(f"duplicate indices: {unique[counts > 1].tolist()}")
+        out_of_range = unique[(unique < 1) | (unique > m)]
+        if len(out_of_range):
+            issues.append(f"indices out of range 1..{m}: {out_of_range.tolist()}")
+
+        problems.append((filename, issues))
+        rows.append(unique[(unique >= 1) & (unique <= m)] - 1)
+
+    # Coverage counts for every file at once: shape (files, n)
+    owner = np.repeat(np.arange(len(rows)), [len(r) for r in rows])
+    file_of, elems = gather_rows(subset_ptr, subset_elems, np.concatenate(rows) if rows else np.empty(0, dtype=np.int64))
+    coverage = np.bincount(owner[file_of] * n + elems, minlength=len(rows) * n).reshape(len(rows), n)
+    uncovered = (coverage == 0).sum(axis=1)
+
+    for k, (filename, issues) in enumerate(problems):
+        if uncovered[k] and not (issues and issues[0].startswith("unreadable")):
+            issues.append(f"invalid cover: {uncovered[k]} of {n} elements uncovered")
+    return problems
+
+
+def instance_name_of(sol_file: str) -> str:
+    """<instance>_<alg>_<cutoff>[_<seed>].sol -> <instance>"""
+    return os.path.basename(sol_file).split('_')[0]
+
+
+def verify_solutions(sol_files: List[str], data_dir: str, workers: int = None) -> Dict[str, List[str]]:
+    """
+    Verify many .sol files, grouped by instance and spread over worker processes.
+
+    Args:
+        sol_files: Paths of the .sol files.
+        data_dir: Directory holding the <instance>.in files.
+        workers: Number of worker processes (defaults to the number of CPUs).
+
+    Returns:
+        Dictionary mapping every file with problems to its list of problems.
+    """
+    groups = defaultdict(list)
+    for filename in sorted(sol_files):
+        groups[os.path.join(data_dir, instance_name_of(filename) + '.in')].append(filename)
+
+    report = {}
+    missing = [path for path in groups if not os.path.exists(path)]
+    for path in missing:
+        for filename in groups.pop(path):
+            report[filename] = [f"instance file not found: {path}"]
+
+    # Batches of one instance stay together so each worker parses few instances
+    batches = [(path, files[i:i + BATCH_SIZE]) for path, files in groups.items() for i in range(0, len(files), BATCH_SIZE)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for results in pool.map(verify_batch, *zip(*batches)) if batches else []:
+            for filename, issues in results:
+                if issues:
+                    report[filename] = issues
+    return report
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Verify .sol files against their instances')
+    parser.add_argument('-sols', required=True, help='Directory containing .sol files, or a glob pattern')
+    parser.add_argument('-data', required=True, help='Directory containing the <instance>.in files')
+    parser.add_argument('-workers', type=int, default=None, help='Number of worker processes (default: number of CPUs)')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    pattern = os.path.join(args.sols, '*.sol') if os.path.isdir(args.sols) else args.sols
+    sol_files = glob.glob(pattern)
+
+    report = verify_solutions(sol_files, args.data, args.workers)
+    for filename in sorted(report):
+        for issue in report[filename]:
+            print(f"{filename}: {issue}")
+    print(f"Checked {len(sol_files)} solutions: {len(sol_files) - len(report)} valid, {len(report)} with problems")
+    if report:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
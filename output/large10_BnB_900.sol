@@ -1,2 +1,2 @@
 319
-0 2 3 4 5 6 7 8 11 12 13 14 16 17 18 19 20 21 22 23 25 26 29 33 35 38 39 40 41 42 46 49 51 52 53 55 56 57 58 60 61 62 63 64 66 72 73 76 78 79 82 85 86 90 95 96 97 100 102 108 112 113 114 117 119 121 123 127 130 132 139 142 143 145 146 148 149 154 155 159 160 161 162 164 165 166 167 171 172 175 176 177 185 186 188 189 191 192 196 199 200 202 207 215 220 228 230 233 236 239 242 243 246 248 253 256 259 263 266 270 273 284 291 293 299 308 310 316 329 330 332 339 358 360 363 377 380 381 382 385 389 400 406 408 411 412 421 422 425 435 436 446 449 452 472 474 477 488 495 497 502 507 510 514 515 526 527 531 532 535 540 541 543 545 548 549 555 559 561 584 593 594 597 603 614 618 620 625 638 641 649 650 661 680 683 711 717 723 728 729 732 739 757 765 766 771 778 785 786 804 811 815 825 826 827 833 834 837 845 847 849 862 869 880 884 892 899 905 930 947 961 968 974 992 1000 1006 1008 1010 1016 1031 1032 1037 1045 1047 1049 1055 1073 1083 1085 1102 1103 1118 1122 1125 1134 1139 1158 1175 1177 1184 1187 1192 1197 1216 1223 1234 1243 1244 1286 1297 1322 1325 1344 1371 1375 1381 1402 1403 1413 1424 1439 1442 1443 1446 1459 1481 1482 1483 1501 1518 1524 1536 1560 1565 1579 1583 1586 1592 1599 1612 1621 1634 1635 1672 1701 1723 1752 1777 1795 1844 1868 1896 1900 1910 1939 1948 1951 1956 1963
+1 3 4 5 6 7 8 9 12 13 14 15 17 18 19 20 21 22 23 24 26 27 30 34 36 39 40 41 42 43 47 50 52 53 54 56 57 58 59 61 62 63 64 65 67 73 74 77 79 80 83 86 87 91 96 97 98 101 103 109 113 114 115 118 120 122 124 128 131 133 140 143 144 146 147 149 150 155 156 160 161 162 163 165 166 167 168 172 173 176 177 178 186 187 189 190 192 193 197 200 201 203 208 216 221 229 231 234 237 240 243 244 247 249 254 257 260 264 267 271 274 285 292 294 300 309 311 317 330 331 333 340 359 361 364 378 381 382 383 386 390 401 407 409 412 413 422 423 426 436 437 447 450 453 473 475 478 489 496 498 503 508 511 515 516 527 528 532 533 536 541 542 544 546 549 550 556 560 562 585 594 595 598 604 615 619 621 626 639 642 650 651 662 681 684 712 718 724 729 730 733 740 758 766 767 772 779 786 787 805 812 816 826 827 828 834 835 838 846 848 850 863 870 881 885 893 900 906 931 948 962 969 975 993 1001 1007 1009 1011 1017 1032 1033 1038 1046 1048 1050 1056 1074 1084 1086 1103 1104 1119 1123 1126 1135 1140 1159 1176 1178 1185 1188 1193 1198 1217 1224 1235 1244 1245 1287 1298 1323 1326 1345 1372 1376 1382 1403 1404 1414 1425 1440 1443 1444 1447 1460 1482 1483 1484 1502 1519 1525 1537 1561 1566 1580 1584 1587 1593 1600 1613 1622 1635 1636 1673 1702 1724 1753 1778 1796 1845 1869 1897 1901 1911 1940 1949 1952 1957 1964
@@ -1,2 +1,2 @@
 56
-0 1 2 6 8 9 13 17 34 40 42 56 62 100 111 112 123 141 143 155 163 165 174 175 190 201 204 207 222 259 263 278 280 288 303 335 365 405 414 531 542 580 593 658 662 960 1026 1083 1301 1385 1514 1579 1694 1747 1777 1924
+1 2 3 7 9 10 14 18 35 41 43 57 63 101 112 113 124 142 144 156 164 166 175 176 191 202 205 208 223 260 264 279 281 289 304 336 366 406 415 532 543 581 594 659 663 961 1027 1084 1302 1386 1515 1580 1695 1748 1778 1925
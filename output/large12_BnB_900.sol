@@ -1,2 +1,2 @@
 18
-9 20 26 28 30 53 77 80 89 113 150 210 216 271 323 331 334 396
+10 21 27 29 31 54 78 81 90 114 151 211 217 272 324 332 335 397
@@ -1,2 +1,2 @@
 83
-0 2 3 5 9 14 27 75 154 158 190 233 257 268 290 296 322 354 371 396 411 416 418 433 455 464 476 477 486 519 544 545 555 562 569 580 634 639 660 668 697 740 774 775 791 792 807 819 823 826 882 895 938 949 967 1026 1069 1089 1112 1145 1187 1271 1303 1313 1335 1371 1425 1479 1521 1530 1538 1560 1569 1573 1652 1664 1695 1720 1722 1743 1811 1886 1974
+1 3 4 6 10 15 28 76 155 159 191 234 258 269 291 297 323 355 372 397 412 417 419 434 456 465 477 478 487 520 545 546 556 563 570 581 635 640 661 669 698 741 775 776 792 793 808 820 824 827 883 896 939 950 968 1027 1070 1090 1113 1146 1188 1272 1304 1314 1336 1372 1426 1480 1522 1531 1539 1561 1570 1574 1653 1665 1696 1721 1723 1744 1812 1887 1975
@@ -1,2 +1,2 @@
 21
-3 13 17 29 43 47 50 60 62 64 70 84 96 122 125 127 150 152 162 184 193
+4 14 18 30 44 48 51 61 63 65 71 85 97 123 126 128 151 153 163 185 194
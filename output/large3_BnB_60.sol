@@ -1,2 +1,2 @@
 17
-2 11 15 22 25 104 123 151 201 215 238 265 274 319 492 585 600
+3 12 16 23 26 105 124 152 202 216 239 266 275 320 493 586 601
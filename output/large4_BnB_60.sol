@@ -1,2 +1,2 @@
 153
-0 1 2 3 4 5 6 7 12 13 14 17 18 22 23 24 27 30 32 34 36 39 50 52 53 56 57 65 73 76 82 83 84 87 89 96 100 114 117 121 123 124 128 129 131 145 147 150 160 173 174 176 178 181 192 195 198 200 202 207 215 222 228 230 232 244 245 250 254 265 266 293 300 308 312 318 334 364 379 380 382 388 394 397 417 420 421 422 425 426 428 429 437 450 451 457 459 463 473 479 482 505 506 537 548 553 558 563 565 569 571 577 581 589 613 615 630 675 683 687 691 693 714 717 723 732 741 743 770 786 790 792 794 796 808 832 851 852 884 895 906 922 932 934 943 968 1020 1039 1112 1130 1135 1143 1159
+1 2 3 4 5 6 7 8 13 14 15 18 19 23 24 25 28 31 33 35 37 40 51 53 54 57 58 66 74 77 83 84 85 88 90 97 101 115 118 122 124 125 129 130 132 146 148 151 161 174 175 177 179 182 193 196 199 201 203 208 216 223 229 231 233 245 246 251 255 266 267 294 301 309 313 319 335 365 380 381 383 389 395 398 418 421 422 423 426 427 429 430 438 451 452 458 460 464 474 480 483 506 507 538 549 554 559 564 566 570 572 578 582 590 614 616 631 676 684 688 692 694 715 718 724 733 742 744 771 787 791 793 795 797 809 833 852 853 885 896 907 923 933 935 944 969 1021 1040 1113 1131 1136 1144 1160
@@ -1,2 +1,2 @@
 8
-3 4 9 54 157 224 227 291
+4 5 10 55 158 225 228 292
@@ -1,2 +1,2 @@
 7
-1 33 82 107 127 277 553
+2 34 83 108 128 278 554
@@ -1,2 +1,2 @@
 172
-0 2 3 5 6 7 10 11 12 13 17 18 24 27 28 32 39 42 46 49 52 55 57 84 87 91 95 106 111 115 119 121 124 131 132 135 142 148 151 154 158 165 178 185 193 200 210 213 215 218 226 230 241 250 258 282 289 332 374 376 390 395 396 397 398 403 404 409 414 417 421 423 428 431 455 499 506 508 520 523 533 538 539 547 553 557 569 573 591 613 618 636 652 675 688 699 701 704 706 714 736 737 755 758 765 770 775 789 812 824 840 841 856 866 868 884 893 914 930 934 935 939 973 995 997 1001 1007 1046 1058 1068 1069 1093 1115 1124 1126 1167 1180 1182 1215 1250 1254 1289 1300 1307 1315 1328 1349 1359 1373 1376 1413 1429 1431 1448 1483 1518 1519 1524 1526 1559 1585 1588 1595 1599 1614 1616 1626 1645 1672 1713 1760 1795
+1 3 4 6 7 8 11 12 13 14 18 19 25 28 29 33 40 43 47 50 53 56 58 85 88 92 96 107 112 116 120 122 125 132 133 136 143 149 152 155 159 166 179 186 194 201 211 214 216 219 227 231 242 251 259 283 290 333 375 377 391 396 397 398 399 404 405 410 415 418 422 424 429 432 456 500 507 509 521 524 534 539 540 548 554 558 570 574 592 614 619 637 653 676 689 700 702 705 707 715 737 738 756 759 766 771 776 790 813 825 841 842 857 867 869 885 894 915 931 935 936 940 974 996 998 1002 1008 1047 1059 1069 1070 1094 1116 1125 1127 1168 1181 1183 1216 1251 1255 1290 1301 1308 1316 1329 1350 1360 1374 1377 1414 1430 1432 1449 1484 1519 1520 1525 1527 1560 1586 1589 1596 1600 1615 1617 1627 1646 1673 1714 1761 1796
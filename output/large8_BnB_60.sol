@@ -1,2 +1,2 @@
 6
-7 12 20 31 286 470
+8 13 21 32 287 471
@@ -1,2 +1,2 @@
 16
-21 28 47 51 56 67 147 148 172 184 288 480 506 529 584 654
+22 29 48 52 57 68 148 149 173 185 289 481 507 530 585 655
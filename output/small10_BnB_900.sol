@@ -1,2 +1,2 @@
 2
-10 14
+11 15
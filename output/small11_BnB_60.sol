@@ -1,2 +1,2 @@
 4
-1 3 5 19
+2 4 6 20
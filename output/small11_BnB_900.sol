@@ -1,2 +1,2 @@
 4
-1 3 13 19
+2 4 14 20
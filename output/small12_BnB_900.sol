@@ -1,2 +1,2 @@
 3
-0 9 15
+1 10 16
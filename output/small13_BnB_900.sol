@@ -1,2 +1,2 @@
 2
-3 8
+4 9
@@ -1,2 +1,2 @@
 2
-2 7
+3 8
@@ -1,2 +1,2 @@
 2
-5 7
+6 8
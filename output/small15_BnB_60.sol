@@ -1,2 +1,2 @@
 2
-13 14
+14 15
@@ -1,2 +1,2 @@
 2
-6 8
+7 9
@@ -1,2 +1,2 @@
 2
-17 18
+18 19
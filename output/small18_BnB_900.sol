@@ -1,2 +1,2 @@
 2
-4 5
+5 6
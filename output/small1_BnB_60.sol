@@ -1,2 +1,2 @@
 5
-0 1 3 7 11
+1 2 4 8 12
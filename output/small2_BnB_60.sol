@@ -1,2 +1,2 @@
 3
-2 7 9
+3 8 10
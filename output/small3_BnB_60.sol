@@ -1,2 +1,2 @@
 5
-0 2 5 7 9
+1 3 6 8 10
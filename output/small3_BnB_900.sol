@@ -1,2 +1,2 @@
 5
-2 5 7 9 12
+3 6 8 10 13
@@ -1,2 +1,2 @@
 4
-0 3 10 11
+1 4 11 12
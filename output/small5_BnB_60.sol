@@ -1,2 +1,2 @@
 5
-0 1 4 5 14
+1 2 5 6 15
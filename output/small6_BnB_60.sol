@@ -1,2 +1,2 @@
 3
-3 5 8
+4 6 9
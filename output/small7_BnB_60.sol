@@ -1,2 +1,2 @@
 3
-5 7 8
+6 8 9
@@ -1,2 +1,2 @@
 2
-3 7
+4 8
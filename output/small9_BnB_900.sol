@@ -1,2 +1,2 @@
 3
-0 4 12
+1 5 13
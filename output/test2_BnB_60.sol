@@ -1,2 +1,2 @@
 2
-2 6
+3 7
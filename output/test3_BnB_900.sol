@@ -1,2 +1,2 @@
 6
-0 2 3 4 5 7
+1 3 4 5 6 8
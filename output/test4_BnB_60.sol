@@ -1,2 +1,2 @@
 4
-0 2 3 4
+1 3 4 5
@@ -1,2 +1,2 @@
 4
-0 2 7 8
+1 3 8 9